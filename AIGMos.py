@@ -4,6 +4,15 @@ from system.core import init_core
 
 def main():
     core = init_core()
+
+    # Tab completion over the alias trie (prefix walk, O(matches))
+    def completer(text, state):
+        matches = core.alias_mgr.complete(text)
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.parse_and_bind("tab: complete")
+
     print("Stage0 REPL (dict -> dict -> dict + expander pipeline)")
     print("Commands: help (lists aliases).")
     print("Exit: quit/exit\n")
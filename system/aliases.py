@@ -3,6 +3,8 @@
 # Stage1: User never invokes sys.* directly.
 # Alias expansion is token0 replacement to internal sys.* primitives.
 
+import sys
+
 ALIASES = {
     "mk":       "sys.mk",
     "rm":       "sys.rm",
@@ -30,6 +32,7 @@ ALIASES = {
     "status":   "sys.status",
     "pause":    "sys.pause",
     "stop":     "sys.stop",
+    "wait":     "sys.wait",
 
     # events
     "ON":       "sys.ev.on",
@@ -38,27 +41,78 @@ ALIASES = {
 
     # LLM chat (system module)
     "Q":        "sys.q.chat",
+    "Q.stream": "sys.q.stream",
 }
 
 
+class _TrieNode:
+    def __init__(self):
+        self.children = {}   # char -> _TrieNode
+        self.value = None    # pre-split expansion tuple if a full alias ends here
+
+
 class AliasManager:
+    # Character trie over alias tokens: has_alias/expand share a single walk
+    # over small nodes instead of hashing the full token on every REPL line,
+    # and prefix completion for readline falls out of the same structure.
     def __init__(self, aliases):
-        self.aliases = dict(aliases)
+        self._root = _TrieNode()
+        for name, exp in aliases.items():
+            self._insert(name, exp)
+
+    def _insert(self, name, exp):
+        node = self._root
+        for ch in name:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = _TrieNode()
+                node.children[ch] = nxt
+            node = nxt
+        # Split once at registration; intern tokens so downstream command
+        # dict lookups compare by identity on the fast path.
+        node.value = tuple(sys.intern(t) for t in exp.strip().split())
+
+    def _walk(self, name):
+        node = self._root
+        for ch in name:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
 
     def has_alias(self, name: str) -> bool:
-        return name in self.aliases
+        node = self._walk(name)
+        return node is not None and node.value is not None
 
     def expand(self, parts):
         if not parts:
             return parts
-        head = parts[0]
-        exp = self.aliases.get(head)
-        if not exp:
+        node = self._walk(parts[0])
+        if node is None or node.value is None:
             return parts
-        return exp.strip().split() + parts[1:]
+        return list(node.value) + parts[1:]
+
+    def complete(self, prefix):
+        """All alias names starting with prefix (sorted), for readline."""
+        node = self._walk(prefix)
+        if node is None:
+            return []
+        out = []
+
+        def rec(n, acc):
+            if n.value is not None:
+                out.append(acc)
+            for ch in sorted(n.children.keys()):
+                rec(n.children[ch], acc + ch)
+
+        rec(node, prefix)
+        return out
 
     def list_aliases(self):
-        return sorted(self.aliases.keys())
+        return self.complete("")
 
     def get_alias(self, name):
-        return self.aliases.get(name)
+        node = self._walk(name)
+        if node is None or node.value is None:
+            return None
+        return " ".join(node.value)
@@ -9,11 +9,52 @@ to prevent circular-import issues while building the command surface.
 from __future__ import annotations
 
 import json
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 from system.model.schema import KVL_ROOTS, LIST_ROOTS, TABLES_ROOT
 
+
+@lru_cache(maxsize=8)
+def _read_json_mtime(path_str: str, mtime: float):
+    # mtime participates in the key, so edits to the file invalidate the
+    # cached parse while repeat init_core() calls skip the disk read.
+    try:
+        return json.loads(Path(path_str).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _load_core_config():
+    p = Path("config/core.json")
+    try:
+        mtime = p.stat().st_mtime
+    except OSError:
+        return {}
+    return _read_json_mtime(str(p), mtime)
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(raw: str):
+    # Runner/event threads re-dispatch the same command lines constantly;
+    # memoizing tokenization turns repeat dispatch into a dict hit.
+    return tuple(raw.strip().split())
+
 class Core:
+    # Slotted: Core attributes are read on every dispatch from three
+    # threads; slots skip the per-instance __dict__ probe.
+    __slots__ = (
+        "kv_roots", "list_roots", "state", "kvl", "l", "tables",
+        "commands", "_handlers", "log", "expanders", "expand_max_passes",
+        "expand_cache_max", "_expand_cache", "alias_mgr", "_surface",
+        "_readonly",
+        "exec_lock", "runners", "runner_locks",
+        "events", "events_by_symbol", "event_latch",
+        "_event_thread", "_event_stop", "_event_wake",
+        "_exec_queue", "_exec_thread",
+    )
+
     def __init__(self):
         self.kv_roots = set(KVL_ROOTS)
         self.list_roots = set(LIST_ROOTS)
@@ -33,11 +74,16 @@ class Core:
         self.l = self.state["lists"]
         self.tables = self.state["tables"]
 
-        self.commands = {}   # cmd -> {handler, help, usage}
-        self.log = []
-        self.expanders = []
+        self.commands = {}   # cmd -> {handler, help, usage} (cold path: help/usage)
+        self._handlers = {}  # cmd -> handler (hot path: one lookup, direct call)
+        self.log = deque(maxlen=1000)  # bounded; O(1) append, no realloc
+        self.expanders = []  # [(fn, trg_only)]
         self.expand_max_passes = 10  # default; can be overridden by config/core.json
+        self.expand_cache_max = 512
+        self._expand_cache = {}  # tuple(parts) -> tuple(expanded); see _expand()
         self.alias_mgr = None  # set in init_core()
+        self._surface = frozenset()  # {"help", *aliases}; set in init_core()
+        self._readonly = set()  # commands dispatched without exec_lock
 
         # ---- runtime gates ----
         # Serialize core.execute across background threads (runner + events poller)
@@ -50,25 +96,40 @@ class Core:
 
         # ---- event runtime ----
         self.events = []         # [{symbol, value, command_parts}]
+        self.events_by_symbol = {}  # symbol -> [(value, command_str)]; kept in sync by topics/events
         self.event_latch = {}    # symbol -> {"armed": bool}
         self._event_thread = None
         self._event_stop = threading.Event()
+        # Trigger writers set this so the event worker wakes immediately
+        # instead of burning a fixed polling tick at idle.
+        self._event_wake = threading.Event()
+        # Fired event commands are queued here and drained by a dedicated
+        # executor thread, so a slow handler never stalls trigger detection.
+        import queue
+        self._exec_queue = queue.SimpleQueue()
+        self._exec_thread = None
 
     def dispatch_internal(self, parts):
         """Dispatch internal sys.* tokens without further expansion."""
         if not parts:
             return ""
         cmd = parts[0]
-        entry = self.commands.get(cmd)
-        if not entry:
+        fn = self._handlers.get(cmd)
+        if fn is None:
             raise ValueError(f"Unknown command: {cmd}")
-        return entry["handler"](self, *parts[1:])
+        return fn(self, *parts[1:])
 
-    def register(self, name, handler, help_text="", usage=""):
+    def register(self, name, handler, help_text="", usage="", readonly=False):
         self.commands[name] = {"handler": handler, "help": help_text, "usage": usage}
+        self._handlers[name] = handler
+        if readonly:
+            self._readonly.add(name)
 
-    def add_expander(self, fn):
-        self.expanders.append(fn)
+    def add_expander(self, fn, trg_only=False):
+        # trg_only expanders can only rewrite *.trg tokens; _expand skips
+        # them wholesale for lines that carry none.
+        self.expanders.append((fn, trg_only))
+        self._expand_cache.clear()
 
     # ---- schema guards (not security) ----
     def _require_kv_root(self, root):
@@ -91,58 +152,107 @@ class Core:
     # --------------------------------------
 
     def _expand(self, parts):
-        seen = set()
+        # Memoized: REPL/runner traffic is highly repetitive, so identical
+        # lines resolve via one dict hit. Expansion is pure w.r.t. the
+        # expander set EXCEPT for *.trg tokens (they read live runner/event
+        # state), so any line containing ".trg" bypasses the cache.
+        cacheable = not any(".trg" in p for p in parts)
+        if cacheable:
+            key = tuple(parts)
+            hit = self._expand_cache.get(key)
+            if hit is not None:
+                return list(hit)
+
+        # Loop detection keeps only integer hashes (bounded by max_passes)
+        # instead of full token tuples; the rolling FNV-1a over per-token
+        # hashes avoids even the tuple allocation per pass.
+        seen_hashes = []
         for _ in range(self.expand_max_passes):
-            sig = tuple(parts)
-            if sig in seen:
+            sig = 0xCBF29CE484222325
+            for p in parts:
+                sig = ((sig ^ hash(p)) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+            if sig in seen_hashes:
                 raise ValueError("Expansion loop detected")
-            seen.add(sig)
+            seen_hashes.append(sig)
 
             changed = False
-            for ex in self.expanders:
+            for ex, trg_only in self.expanders:
+                if trg_only and cacheable:  # cacheable == "no .trg tokens"
+                    continue
                 new_parts = ex(parts)
                 if new_parts != parts:
                     parts = new_parts
                     changed = True
                     break
             if not changed:
+                if cacheable:
+                    if len(self._expand_cache) >= self.expand_cache_max:
+                        self._expand_cache.clear()
+                    self._expand_cache[key] = tuple(parts)
                 return parts
 
         raise ValueError(f"Expansion depth exceeded (max_passes={self.expand_max_passes})")
 
     def execute(self, raw):
-        with self.exec_lock:
-            self.log.append({"in": raw})
+        self.log.append({"in": raw})
 
-            parts = raw.strip().split()
-            if not parts:
-                return None
+        parts = list(_tokenize(raw))
+        if not parts:
+            return None
+
+        # --- EXPOSED SURFACE GATE: only aliases + help ---
+        # Single frozenset probe instead of alias_mgr attribute walk.
+        # Gate + help run before exec_lock: neither mutates state, so
+        # the high-frequency no-op paths skip lock acquisition entirely
+        # (deque.append is atomic under the GIL).
+        head = parts[0]
+        if head not in self._surface:
+            return "Unknown command"
+        # ----------------------------------------------
+
+        if head == "help":
+            fn = self._handlers.get("help")
+            if fn:
+                try:
+                    out = fn(self, *parts[1:])
+                except Exception as e:
+                    out = f"Error: {e}"
+                self.log.append({"out": out})
+                return out
 
-            # --- EXPOSED SURFACE GATE: only aliases + help ---
-            head = parts[0]
-            if head != "help":
-                if not self.alias_mgr or not self.alias_mgr.has_alias(head):
-                    return "Unknown command"
-            # ----------------------------------------------
+        # Expansion only reads expander/alias state — safe outside the lock.
+        try:
+            parts = self._expand(parts)
+        except Exception as e:
+            out = f"Error: {e}"
+            self.log.append({"out": out})
+            return out
+
+        cmd, *args = parts
+        fn = self._handlers.get(cmd)
+        if fn is None:
+            return f"Unknown command: {cmd}"
 
+        if cmd in self._readonly:
+            # Readonly primitives need a consistent snapshot, not
+            # serialization; GIL-level dict atomicity is enough.
             try:
-                parts = self._expand(parts)
+                out = fn(self, *args)
             except Exception as e:
                 out = f"Error: {e}"
-                self.log.append({"out": out})
-                return out
-
-            cmd, *args = parts
-            entry = self.commands.get(cmd)
-            if not entry:
-                return f"Unknown command: {cmd}"
+            self.log.append({"out": out})
+            return out
 
+        # exec_lock stays an RLock: sys.run single-shot re-enters execute.
+        with self.exec_lock:
             try:
-                out = entry["handler"](self, *args)
+                out = fn(self, *args)
             except Exception as e:
                 out = f"Error: {e}"
 
             self.log.append({"out": out})
+            # Any write command may have moved a $/# trigger leaf.
+            self._event_wake.set()
             return out
 
 
@@ -195,15 +305,6 @@ def init_core():
 
     core = Core()
 
-    def _load_core_config():
-        p = Path("config/core.json")
-        if not p.exists():
-            return {}
-        try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-
     cfg = _load_core_config()
     if "expand_max_passes" in cfg:
         try:
@@ -212,17 +313,21 @@ def init_core():
             pass
 
     # register internal primitives
+    # sys.wait blocks for up to timeout_s; it only reads job.trg under the
+    # job's own condition, so it must not hold exec_lock while waiting.
+    READONLY = {"sys.ls", "sys.cat", "sys.status", "sys.ev.show", "sys.wait"}
     for name, (handler, help_text, usage) in ALL_COMMANDS.items():
-        core.register(name, handler, help_text, usage)
+        core.register(name, handler, help_text, usage, readonly=(name in READONLY))
 
     # attach aliases
     core.alias_mgr = AliasManager(ALIASES)
+    core._surface = frozenset({"help", *ALIASES.keys()})
     core.add_expander(core.alias_mgr.expand)
 
-    # *.trg numeric expanders
-    core.add_expander(lambda parts: expand_runner_trg(core, parts))
-    core.add_expander(lambda parts: expand_text_trg(core, parts))
-    core.add_expander(lambda parts: expand_table_trg(core, parts))
+    # *.trg numeric expanders (skipped for lines without .trg tokens)
+    core.add_expander(lambda parts: expand_runner_trg(core, parts), trg_only=True)
+    core.add_expander(lambda parts: expand_text_trg(core, parts), trg_only=True)
+    core.add_expander(lambda parts: expand_table_trg(core, parts), trg_only=True)
 
     # exposed help
     core.register(
@@ -2,11 +2,15 @@
 # Store-based primitives (no Core dependency).
 # store shape: store[root][sub][key] = scalar
 
+import sys
+
 def sub_ls(store, root):
-    return sorted(store[root].keys())
+    return sorted(store[root])
 
 def sub_mk(store, root, sub):
-    store[root].setdefault(sub, {})
+    # Interned sub names let the chained store[root][sub] probes compare
+    # by identity on repeat lookups from runner/event loops.
+    store[root].setdefault(sys.intern(sub), {})
     return "OK"
 
 def sub_rm(store, root, sub):
@@ -14,10 +18,10 @@ def sub_rm(store, root, sub):
     return "OK"
 
 def kv_ls(store, root, sub):
-    return sorted(store[root][sub].keys())
+    return sorted(store[root][sub])
 
 def kv_set(store, root, sub, key, value):
-    store[root][sub][key] = value
+    store[root][sub][sys.intern(key)] = value
     return "OK"
 
 def kv_get(store, root, sub, key):
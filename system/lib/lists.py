@@ -2,11 +2,14 @@
 # Store-based primitives (no Core dependency).
 # store shape: store[root][sub] = list
 
+import sys
+
 def sub_ls(store, root):
-    return sorted(store[root].keys())
+    return sorted(store[root])
 
 def sub_mk(store, root, sub):
-    store[root].setdefault(sub, [])
+    # Interned like kvlists.sub_mk: identity-compare on repeat probes.
+    store[root].setdefault(sys.intern(sub), [])
     return "OK"
 
 def sub_rm(store, root, sub):
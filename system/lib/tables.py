@@ -8,12 +8,22 @@
 #     - scalar (leaf)  (usually str)
 #
 # Used by topics (runner/events/io/planner) without importing surface.py.
+#
+# Representation note (Stage1): plain nested dicts are a deliberate choice.
+# A compacted (PATRICIA) or SQLite-backed node store was evaluated and
+# rejected for now — surface.py, io.py and events.py all treat tree nodes
+# as raw dicts (isinstance checks, direct clone/pop), so the nested-dict
+# shape is part of the store contract, and the in-memory Core predates any
+# persistence wiring (see model/schema.py for the ready-to-wire DDL).
 
 from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Tuple
 
 
+_MISSING = object()  # sentinel: lets walks hash each key once via dict.get
+
+
 def _root_dict(store: Dict[str, Any], root: str) -> Dict[str, Any]:
     store.setdefault(root, {})
     r = store[root]
@@ -24,22 +34,26 @@ def _root_dict(store: Dict[str, Any], root: str) -> Dict[str, Any]:
 
 
 def node_get(store: Dict[str, Any], root: str, path: List[str]) -> Any:
+    # type(x) is dict (nodes are plain dicts) + one dict.get per hop:
+    # each key is hashed once instead of `in` + `[]`.
     cur: Any = _root_dict(store, root)
     for p in path:
-        if not isinstance(cur, dict) or p not in cur:
+        if type(cur) is not dict:
+            return None
+        cur = cur.get(p, _MISSING)
+        if cur is _MISSING:
             return None
-        cur = cur[p]
     return cur
 
 
 def node_ensure_dict(store: Dict[str, Any], root: str, path: List[str]) -> Dict[str, Any]:
     cur: Any = _root_dict(store, root)
     for p in path:
-        nxt = cur.get(p)
-        if nxt is None:
+        nxt = cur.get(p, _MISSING)
+        if nxt is _MISSING or nxt is None:
             nxt = {}
             cur[p] = nxt
-        elif not isinstance(nxt, dict):
+        elif type(nxt) is not dict:
             raise ValueError(f"Path collision at '{p}'")
         cur = nxt
     return cur
@@ -49,7 +63,7 @@ def node_ls(store: Dict[str, Any], root: str, path: List[str]) -> List[str]:
     node = node_get(store, root, path)
     if not isinstance(node, dict):
         raise ValueError("ls expects dict node")
-    return sorted(node.keys())
+    return sorted(node)
 
 
 def leaf_set(store: Dict[str, Any], root: str, path: List[str], text: str) -> None:
@@ -91,20 +105,38 @@ def node_set(store: Dict[str, Any], root: str, path: List[str], node: Any) -> No
     parent[k] = node
 
 
+def count_leaves(store: Dict[str, Any], root: str, base_path: List[str]) -> int:
+    """Count leaves under base_path without materializing paths/texts."""
+    start = node_get(store, root, base_path)
+    if start is None:
+        return 0
+    n = 0
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        else:
+            n += 1
+    return n
+
+
 def walk_leaves(store: Dict[str, Any], root: str, base_path: List[str]) -> List[Tuple[List[str], str]]:
     """Return (path_tokens, leaf_text) for all leaves under base_path, sorted by path."""
     start = node_get(store, root, base_path)
     if start is None:
         return []
-    out: List[Tuple[List[str], str]] = []
 
-    def rec(cur_path: List[str], node: Any):
+    # Iterative DFS: children are pushed in reverse-sorted order so popping
+    # visits them sorted, which makes the output lexicographic by path
+    # already — no trailing sort, no recursion frames.
+    out: List[Tuple[List[str], str]] = []
+    stack: List[Tuple[List[str], Any]] = [(list(base_path), start)]
+    while stack:
+        cur_path, node = stack.pop()
         if isinstance(node, dict):
-            for k in sorted(node.keys()):
-                rec(cur_path + [k], node[k])
+            for k in sorted(node.keys(), reverse=True):
+                stack.append((cur_path + [k], node[k]))
         else:
             out.append((cur_path, str(node)))
-
-    rec(list(base_path), start)
-    out.sort(key=lambda t: tuple(t[0]))
     return out
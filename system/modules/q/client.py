@@ -10,13 +10,43 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from functools import lru_cache
 
-@dataclass(frozen=True)
+try:
+    import orjson as _orjson  # ~3x faster encode/decode for message payloads
+except ImportError:
+    _orjson = None
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _read_json_mtime(path_str: str, mtime: float) -> Dict[str, Any]:
+    # Keyed by mtime: repeat QChat() constructions skip the stat+read,
+    # while on-disk edits still invalidate the cached parse.
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+
+@dataclass(frozen=True, slots=True)
 class QConfig:
     base_url: str
     timeout_ms: int = 8000
     poll_interval_ms: int = 200
     model: str = "llama3.1:8b"
+    stream: bool = False  # opt-in: server supports /v1/chat/stream (SSE)
+    http2: bool = False   # opt-in: multiplex concurrent chats over one connection
 
 
 class QChatError(RuntimeError):
@@ -40,13 +70,57 @@ class QChat:
     def __init__(self, config_path: str | Path):
         self._cfg_path = Path(config_path)
         self.cfg = self._load_config(self._cfg_path)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None  # loop the client was created on
+        # Invariant payload skeleton; chat() only patches messages/timeout.
+        args: Dict[str, Any] = {}
+        if self.cfg.model:
+            args["model"] = self.cfg.model
+        self._payload_skeleton: Dict[str, Any] = {
+            "op": "llm.chat",
+            "args": args,
+            "timeout_ms": self.cfg.timeout_ms,
+        }
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        # Lazy persistent client: reuses keep-alive connections across chat
+        # calls instead of paying TCP handshake per call. If the running loop
+        # changed (callers bridging via asyncio.run get a fresh loop each
+        # time), the old client is unusable — drop it and build a new one.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            kwargs: Dict[str, Any] = dict(
+                base_url=self.cfg.base_url,
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+            )
+            if self.cfg.http2:
+                try:
+                    self._client = httpx.AsyncClient(http2=True, **kwargs)
+                except ImportError:
+                    # h2 not installed; fall back to HTTP/1.1 keep-alive.
+                    self._client = httpx.AsyncClient(**kwargs)
+            else:
+                self._client = httpx.AsyncClient(**kwargs)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            finally:
+                self._client = None
+                self._client_loop = None
 
     @staticmethod
     def _load_config(path: Path) -> QConfig:
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
             raise FileNotFoundError(f"Q config not found: {path}")
 
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = _read_json_mtime(str(path), mtime)
 
         base_url = (raw.get("base_url") or "").strip()
         if not base_url:
@@ -66,8 +140,42 @@ class QChat:
             timeout_ms=timeout_ms,
             poll_interval_ms=poll_interval_ms,
             model=model,
+            stream=bool(raw.get("stream", False)),
+            http2=bool(raw.get("http2", False)),
         )
 
+    async def chat_stream(self, messages: List[Dict[str, Any]], *, timeout_ms: Optional[int] = None):
+        """SSE variant: yields assistant text deltas as they arrive.
+
+        Requires a backend exposing POST /v1/chat/stream (config.stream).
+        One round trip, no status polling.
+        """
+        cfg = self.cfg
+        overall_timeout_ms = cfg.timeout_ms if timeout_ms is None else int(timeout_ms)
+        payload: Dict[str, Any] = {
+            "op": "llm.chat",
+            "args": {"messages": messages, "model": cfg.model},
+            "timeout_ms": overall_timeout_ms,
+        }
+        client = await self._get_client()
+        try:
+            async with client.stream("POST", "/v1/chat/stream", json=payload) as r:
+                if r.status_code != 200:
+                    raise QChatError(f"stream failed: HTTP {r.status_code}")
+                async for line in r.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = json.loads(line[6:])
+                    delta = data.get("delta")
+                    if isinstance(delta, str) and delta:
+                        yield delta
+                    if data.get("done"):
+                        return
+        except QChatError:
+            raise
+        except Exception as e:
+            raise QChatError(f"stream failed: {e}") from e
+
     async def chat(
         self,
         messages: List[Dict[str, Any]],
@@ -90,70 +198,90 @@ class QChat:
             if not isinstance(m, dict) or "role" not in m or "content" not in m:
                 raise ValueError("each message must be dict with keys: role, content")
 
-        # Build standard payload. No simulate knobs.
-        args: Dict[str, Any] = {"messages": messages}
-        # Keep contract realistic: include model
-        if cfg.model:
-            args["model"] = cfg.model
-
+        # Patch messages/timeout into the prebuilt skeleton. No simulate knobs.
+        skel = self._payload_skeleton
         payload: Dict[str, Any] = {
-            "op": "llm.chat",
-            "args": args,
+            **skel,
+            "args": {**skel["args"], "messages": messages},
             "timeout_ms": overall_timeout_ms,
         }
         if trace_id:
             payload["trace_id"] = trace_id
 
+        # Streaming backend: one round trip, no polling loop. Any stream
+        # failure falls back to the submit+poll path below.
+        if cfg.stream:
+            try:
+                chunks: List[str] = []
+                async for delta in self.chat_stream(messages, timeout_ms=overall_timeout_ms):
+                    chunks.append(delta)
+                return "".join(chunks)
+            except QChatError:
+                pass
+
         t0 = time.monotonic()
         deadline = t0 + (overall_timeout_ms / 1000.0 if overall_timeout_ms > 0 else 0.0)
 
-        async with httpx.AsyncClient(base_url=cfg.base_url) as client:
-            job_id = await self._submit(client, payload)
+        client = await self._get_client()
+        job_id = await self._submit(client, payload)
 
-            try:
-                while True:
-                    status = await self._get_status(client, job_id)
-                    state = status.get("state")
-
-                    if state == "ok":
-                        result = status.get("result") or {}
-                        text = result.get("text")
-                        if not isinstance(text, str):
-                            raise QChatError("Malformed response: result.text missing")
-                        return text
-
-                    if state in ("fail", "timeout", "cancelled"):
-                        err = status.get("error") or {}
-                        code = err.get("code", "ERROR")
-                        msg = err.get("message", "unknown error")
-                        raise QChatError(f"{code}: {msg}")
-
-                    # queued / running / unknown -> keep polling
-                    if overall_timeout_ms > 0 and time.monotonic() >= deadline:
-                        # best-effort cancel
-                        await self._cancel_silent(client, job_id)
-                        raise QChatTimeout("Q timeout")
-
-                    if poll_ms > 0:
-                        await asyncio.sleep(poll_ms / 1000.0)
-                    else:
-                        await asyncio.sleep(0)
-
-            except Exception:
-                # If something blows up mid-flight, best-effort cancel to avoid hangs.
-                await self._cancel_silent(client, job_id)
-                raise
+        # Adaptive poll backoff: start fast so snappy jobs return quickly,
+        # grow toward the configured interval for slow jobs. A server-sent
+        # retry_after_ms overrides the local schedule.
+        poll_cap = poll_ms / 1000.0
+        cur_sleep = min(0.01, poll_cap) if poll_cap > 0 else 0.0
+
+        try:
+            while True:
+                status = await self._get_status(client, job_id)
+                state = status.get("state")
+
+                if state == "ok":
+                    result = status.get("result") or {}
+                    text = result.get("text")
+                    if not isinstance(text, str):
+                        raise QChatError("Malformed response: result.text missing")
+                    return text
+
+                if state in ("fail", "timeout", "cancelled"):
+                    err = status.get("error") or {}
+                    code = err.get("code", "ERROR")
+                    msg = err.get("message", "unknown error")
+                    raise QChatError(f"{code}: {msg}")
+
+                # queued / running / unknown -> keep polling
+                if overall_timeout_ms > 0 and time.monotonic() >= deadline:
+                    # best-effort cancel
+                    await self._cancel_silent(client, job_id)
+                    raise QChatTimeout("Q timeout")
+
+                retry_after = status.get("retry_after_ms")
+                if retry_after is not None:
+                    try:
+                        await asyncio.sleep(max(0, int(retry_after)) / 1000.0)
+                    except (TypeError, ValueError):
+                        await asyncio.sleep(cur_sleep)
+                else:
+                    await asyncio.sleep(cur_sleep)
+                    cur_sleep = min(cur_sleep * 1.5, poll_cap)
+
+        except Exception:
+            # If something blows up mid-flight, best-effort cancel to avoid hangs.
+            await self._cancel_silent(client, job_id)
+            raise
 
     async def _submit(self, client: httpx.AsyncClient, payload: Dict[str, Any]) -> str:
         try:
-            r = await client.post("/v1/jobs", json=payload, timeout=10.0)
+            r = await client.post(
+                "/v1/jobs", content=_json_dumps(payload), headers=_JSON_HEADERS, timeout=10.0
+            )
         except Exception as e:
             raise QChatError(f"submit failed: {e}") from e
 
         if r.status_code not in (200, 201):
             raise QChatError(f"submit failed: HTTP {r.status_code} :: {r.text}")
 
-        data = r.json()
+        data = _json_loads(r.content)
         job_id = data.get("id")
         if not isinstance(job_id, str) or not job_id:
             raise QChatError("submit failed: missing job id")
@@ -168,7 +296,7 @@ class QChat:
         if r.status_code != 200:
             raise QChatError(f"poll failed: HTTP {r.status_code} :: {r.text}")
 
-        data = r.json()
+        data = _json_loads(r.content)
         if not isinstance(data, dict):
             raise QChatError("poll failed: non-object json")
         return data
@@ -1,6 +1,9 @@
 # system/topics/__init__.py
 # Explicit inclusion (Stage1)
 
+import sys
+from types import MappingProxyType
+
 from .kvlists import COMMANDS as KVLISTS_COMMANDS
 from .lists import COMMANDS as LISTS_COMMANDS
 from .texts import COMMANDS as TEXTS_COMMANDS
@@ -10,12 +13,17 @@ from .surface import COMMANDS as SURFACE_COMMANDS
 from .qchat import COMMANDS as QCHAT_COMMANDS
 from .io import COMMANDS as IO_COMMANDS
 
-ALL_COMMANDS = {}
-ALL_COMMANDS.update(KVLISTS_COMMANDS)
-ALL_COMMANDS.update(LISTS_COMMANDS)
-ALL_COMMANDS.update(TEXTS_COMMANDS)
-ALL_COMMANDS.update(RUNNER_COMMANDS)
-ALL_COMMANDS.update(EVENTS_COMMANDS)
-ALL_COMMANDS.update(SURFACE_COMMANDS)
-ALL_COMMANDS.update(QCHAT_COMMANDS)
-ALL_COMMANDS.update(IO_COMMANDS)
+_MERGED = {}
+_MERGED.update(KVLISTS_COMMANDS)
+_MERGED.update(LISTS_COMMANDS)
+_MERGED.update(TEXTS_COMMANDS)
+_MERGED.update(RUNNER_COMMANDS)
+_MERGED.update(EVENTS_COMMANDS)
+_MERGED.update(SURFACE_COMMANDS)
+_MERGED.update(QCHAT_COMMANDS)
+_MERGED.update(IO_COMMANDS)
+
+# Merged once at import, keys interned (dispatch compares by pointer
+# first), and frozen — the surface is fixed for the life of the process.
+ALL_COMMANDS = MappingProxyType({sys.intern(k): v for k, v in _MERGED.items()})
+del _MERGED
@@ -18,10 +18,14 @@
 # Special:
 #   trigger value 3 => purge bindings for that exact symbol (no commands executed)
 
-import time
+import queue
 import threading
+from functools import lru_cache
+
+from system.lib import tables as tbl
 
 TEXTS_ROOT = "texts"
+TABLES_ROOT = "tables"
 
 
 def _is_trg_symbol(sym: str) -> bool:
@@ -32,12 +36,24 @@ def _match_pattern(sym: str, pat: str) -> bool:
     # 1.0 minimal patterns:
     # - exact match
     # - "*.trg" matches any symbol ending with ".trg"
-    if pat == "*.trg":
-        return sym.endswith(".trg")
-    return sym == pat
+    # Only two cases exist; callers iterating bindings hoist the
+    # wildcard check out of the loop instead of calling per binding.
+    return sym == pat or (pat == "*.trg" and sym.endswith(".trg"))
+
+
+@lru_cache(maxsize=1024)
+def _parse_int_str(s: str) -> int:
+    # Trigger values are a tiny vocabulary ("0"/"1"/"2"/"3" dominate);
+    # memoizing makes repeat per-tick parses a dict hit.
+    try:
+        return int(s.strip())
+    except Exception:
+        return 0
 
 
 def _parse_int(x) -> int:
+    if type(x) is str:
+        return _parse_int_str(x)
     try:
         return int(str(x).strip())
     except Exception:
@@ -66,8 +82,6 @@ def expand_text_trg(core, parts):
 
 def expand_table_trg(core, parts):
     # Expand #path (where last segment ends with .trg) leaf scalar to int
-    from system.lib import tables as tbl
-
     out = []
     changed = False
     for p in parts:
@@ -75,7 +89,7 @@ def expand_table_trg(core, parts):
             path = [x for x in p[1:].split(":") if x] if len(p) > 1 else []
             if path and str(path[-1]).endswith(".trg"):
                 try:
-                    node = tbl.node_get(core.tables, tbl.ROOT, path)
+                    node = tbl.node_get(core.tables, TABLES_ROOT, path)
                     if isinstance(node, dict):
                         v = 0
                     else:
@@ -102,20 +116,21 @@ def _resolve_trg_int(core, sym: str) -> int:
 
 
 def _event_worker(core):
-    TICK = 0.05  # 50ms
+    # Wake-up driven: trigger writers (core.execute write path, runner
+    # pulses) set core._event_wake, so idle cost is one blocked wait and
+    # fire latency is no longer up-to-TICK. The timeout is a safety net
+    # for writers that mutate trg leaves without going through execute.
+    TICK = 1.0
     while not core._event_stop.is_set():
-        # watched symbols (dedup, stable)
-        symbols = []
-        for e in core.events:
-            s = e.get("symbol")
-            if isinstance(s, str) and s not in symbols:
-                symbols.append(s)
-
-        for sym in symbols:
+        # watched symbols: index keys are already deduped, insertion-stable,
+        # so each symbol is resolved exactly once per tick — a per-tick
+        # memo on _resolve_trg_int would never hit.
+        for sym in list(core.events_by_symbol.keys()):
             val = _resolve_trg_int(core, sym)
 
             # purge-only
             if val == 3:
+                core.events_by_symbol.pop(sym, None)
                 core.events = [e for e in core.events if e.get("symbol") != sym]
                 core.event_latch.pop(sym, None)
                 continue
@@ -132,19 +147,29 @@ def _event_worker(core):
             # fire once per (sym,val), then disarm until back to 0
             latch["armed"] = False
 
-            matches = [e for e in core.events if e.get("symbol") == sym and int(e.get("value", 0)) == val]
-            for e in matches:
-                cmd_parts = e.get("command", [])
-                if not cmd_parts:
-                    continue
+            # Runner-control ("run %..." etc.) is rejected at on() bind time,
+            # so every stored binding is fire-safe — no per-fire recheck.
+            # Buckets hold packed (value, command_str) pairs: the hot loop
+            # touches two tuple slots, never a binding dict.
+            # Detection is decoupled from dispatch: fired commands go to
+            # the executor queue, so a slow handler can't back up the
+            # latch scan across ticks.
+            for v, cmd in core.events_by_symbol.get(sym, ()):
+                if v == val:
+                    core._exec_queue.put(cmd)
 
-                # hard rule: events cannot control runners (%)
-                if len(cmd_parts) >= 2 and cmd_parts[0] in ("run", "status", "pause", "stop") and str(cmd_parts[1]).startswith("%"):
-                    continue
+        core._event_wake.wait(timeout=TICK)
+        core._event_wake.clear()
 
-                core.execute(" ".join(str(x) for x in cmd_parts))
 
-        time.sleep(TICK)
+def _exec_worker(core):
+    # Single writer: drains fired commands in order, one at a time.
+    while not core._event_stop.is_set():
+        try:
+            cmd = core._exec_queue.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        core.execute(cmd)
 
 
 def _ensure_event_thread(core):
@@ -154,6 +179,10 @@ def _ensure_event_thread(core):
     t = threading.Thread(target=_event_worker, args=(core,), name="event:poll", daemon=True)
     core._event_thread = t
     t.start()
+    if not (core._exec_thread and core._exec_thread.is_alive()):
+        x = threading.Thread(target=_exec_worker, args=(core,), name="event:exec", daemon=True)
+        core._exec_thread = x
+        x.start()
 
 
 def on(core, symbol, value, *command_parts):
@@ -174,11 +203,17 @@ def on(core, symbol, value, *command_parts):
     if len(command_parts) >= 2 and command_parts[0] in ("run", "status", "pause", "stop") and str(command_parts[1]).startswith("%"):
         raise ValueError("Events cannot control runners (%)")
 
-    core.events.append({
+    binding = {
         "symbol": sym,
         "value": int(v),
         "command": list(command_parts),
-    })
+        # prebuilt: the worker fires this string verbatim on every match
+        "command_str": " ".join(str(x) for x in command_parts),
+    }
+    core.events.append(binding)
+    # hot-path index: packed pairs, not the dicts (those stay in
+    # core.events for ON.show / ON.reset)
+    core.events_by_symbol.setdefault(sym, []).append((binding["value"], binding["command_str"]))
 
     _ensure_event_thread(core)
     return "OK"
@@ -186,26 +221,29 @@ def on(core, symbol, value, *command_parts):
 
 def show(core, pattern):
     pat = str(pattern)
+    wild = pat == "*.trg"
     lines = []
     for e in core.events:
         sym = e.get("symbol", "")
-        if _match_pattern(sym, pat):
-            lines.append(f'{sym} {int(e.get("value", 0))} ' + " ".join(str(x) for x in e.get("command", [])))
+        if sym == pat or (wild and sym.endswith(".trg")):
+            lines.append(f'{sym} {int(e.get("value", 0))} ' + e.get("command_str", ""))
     return "\n".join(lines)
 
 
 def reset(core, pattern):
     pat = str(pattern)
+    wild = pat == "*.trg"
     removed_syms = set()
     keep = []
     for e in core.events:
         sym = e.get("symbol", "")
-        if _match_pattern(sym, pat):
+        if sym == pat or (wild and sym.endswith(".trg")):
             removed_syms.add(sym)
             continue
         keep.append(e)
     core.events = keep
     for sym in removed_syms:
+        core.events_by_symbol.pop(sym, None)
         core.event_latch.pop(sym, None)
     return "OK"
 
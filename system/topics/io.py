@@ -14,9 +14,11 @@
 
 from __future__ import annotations
 
+import codecs
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
@@ -64,8 +66,10 @@ def _ensure_output_dir():
     Path("./output").mkdir(parents=True, exist_ok=True)
 
 
-def _atomic_write_text(dst: Path, text: str):
-    dst.parent.mkdir(parents=True, exist_ok=True)
+def _atomic_write_text(dst: Path, text: str, ensure_parent: bool = True):
+    # ensure_parent=False for bulk callers that pre-create parent dirs once.
+    if ensure_parent:
+        dst.parent.mkdir(parents=True, exist_ok=True)
     tmp = dst.with_name(dst.name + ".tmp")
     tmp.write_text(text, encoding="utf-8")
     tmp.replace(dst)
@@ -74,6 +78,7 @@ def _atomic_write_text(dst: Path, text: str):
 @dataclass
 class _IgnoreRule:
     base_dir: Path          # directory containing the .ignore file
+    base_prefix: str        # posix str of base_dir + '/', for ancestor checks
     pattern: str            # pattern as written (trimmed/unescaped)
     negated: bool           # True if starts with '!'
     dir_only: bool          # True if endswith '/'
@@ -81,6 +86,22 @@ class _IgnoreRule:
     regex: re.Pattern       # compiled matcher against posix rel path
 
 
+def _sniff_utf8(p: Path, probe: int = 8192) -> bool:
+    """Cheap binary check: decode only the first probe bytes.
+
+    final=False tolerates a multi-byte sequence cut at the probe boundary;
+    a hard decode error this early means the file is not UTF-8 text, so
+    bulk import never has to read (or decode) the rest of a binary.
+    """
+    with open(p, "rb") as f:
+        buf = f.read(probe)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(buf, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
 def _read_utf8_strict(p: Path) -> str:
     try:
         return p.read_text(encoding="utf-8")
@@ -88,22 +109,17 @@ def _read_utf8_strict(p: Path) -> str:
         raise ValueError(f"UTF-8 decode error in file: {p} (abs={p.resolve()}) :: {e}") from e
 
 
+# One pass per .ignore line: optional leading '!', then either a body kept
+# verbatim because it ends with an escaped space, or a lazily-matched body
+# with unescaped trailing spaces trimmed. Compiled once at module scope.
+_IGNORE_LINE_RE = re.compile(r"^(!?)(.*\\ $|.*?) *$")
+_UNESCAPE_RE = re.compile(r"\\(.)")
+
+
 def _gitignore_unescape(s: str) -> str:
     # Minimal gitignore-style unescape for leading escape sequences.
-    # Handles: \#, \!, \ , \\
-    out = []
-    esc = False
-    for ch in s:
-        if esc:
-            out.append(ch)
-            esc = False
-        elif ch == "\\":
-            esc = True
-        else:
-            out.append(ch)
-    if esc:
-        out.append("\\")
-    return "".join(out)
+    # Handles: \#, \!, \ , \\  (a lone trailing backslash is kept as-is)
+    return _UNESCAPE_RE.sub(r"\1", s)
 
 
 def _gitignore_line_parse(line: str):
@@ -116,23 +132,18 @@ def _gitignore_line_parse(line: str):
     if s.startswith("#"):
         return None
 
-    # handle trailing spaces (gitignore: trailing spaces ignored unless escaped)
-    # MVP: trim right spaces if not escaped
-    if s.endswith(" ") and not s.endswith("\ "):
-        s = s.rstrip(" ")
-
-    neg = False
-    if s.startswith("!"):
-        neg = True
-        s = s[1:]
-    s = _gitignore_unescape(s)
-    if not s:
+    m = _IGNORE_LINE_RE.match(s)
+    neg, body = m.group(1) == "!", m.group(2)
+    body = _gitignore_unescape(body)
+    if not body:
         return None
-    return neg, s
+    return neg, body
 
 
+@lru_cache(maxsize=256)
 def _gitignore_pattern_to_regex(pat: str):
-    # Convert gitignore glob to regex.
+    # Convert gitignore glob to regex. Memoized: the same patterns recur
+    # across nested .ignore files and repeat import.many runs.
     # Rules:
     # - '*'  => [^/]* (does not cross '/')
     # - '?'  => [^/]
@@ -193,8 +204,12 @@ def _compile_ignore_rule(base_dir: Path, negated: bool, raw_pat: str) -> _Ignore
     # Build regex anchored to full relative path
     rx = _gitignore_pattern_to_regex(pat)
     regex = re.compile(r"^" + rx + r"($|/.*$)") if dir_only else re.compile(r"^" + rx + r"$")
+    # '.' as base must become the empty prefix: candidates are built via
+    # Path(), which normalizes './x' to 'x', so './' would never match.
+    base_posix = base_dir.as_posix().rstrip("/")
     return _IgnoreRule(
         base_dir=base_dir,
+        base_prefix="" if base_posix == "." else base_posix + "/",
         pattern=raw_pat,
         negated=negated,
         dir_only=dir_only,
@@ -222,17 +237,33 @@ def _load_ignore_rules(dir_path: Path):
     return rules
 
 
-def _is_ignored(path_abs: Path, is_dir: bool, rules_stack):
+def _is_ignored(path_abs: Path, is_dir: bool, rules_stack, has_neg: bool = True):
     # Gitignore-equivalent: last match wins (across stacked .ignore files)
     # Candidate path is tested as rel path from each rule.base_dir (if applicable).
+    # Ancestor test is a string prefix check (rules and candidates come
+    # from the same walk, so their path spelling is consistent) — no
+    # relative_to + exception per non-ancestor rule.
+    path_str = path_abs.as_posix()
+
+    if not has_neg:
+        # No '!' rule anywhere in the stack (the common case): later rules
+        # can never flip a positive match, so the first hit decides.
+        for rule in rules_stack:
+            prefix = rule.base_prefix
+            if not path_str.startswith(prefix):
+                continue
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(path_str[len(prefix):]):
+                return True
+        return False
+
     decision = None  # None=not matched yet, True=ignored, False=included
     for rule in rules_stack:
-        try:
-            rel = path_abs.relative_to(rule.base_dir).as_posix()
-        except Exception:
-            continue
-        if rel == ".":
+        prefix = rule.base_prefix
+        if not path_str.startswith(prefix):
             continue
+        rel = path_str[len(prefix):]
         if rule.dir_only and not is_dir:
             # dir-only rule doesn't match files directly
             continue
@@ -281,48 +312,49 @@ def import_many(core, src_dir: str, dst_root: str):
     skipped_binary = 0
     skipped_other = 0
 
-    def walk_dir(dir_abs: Path, rules_stack):
+    def walk_dir(dir_abs: Path, rules_stack, has_neg: bool, rel_tokens):
         nonlocal imported, skipped_ignore, skipped_binary, skipped_other
 
         # load .ignore here (gitignore-equivalent cascading)
         local_rules = _load_ignore_rules(dir_abs)
         if local_rules:
             rules_stack = rules_stack + local_rules
+            has_neg = has_neg or any(r.negated for r in local_rules)
 
-        # deterministic traversal
+        # deterministic traversal; scandir DirEntry caches the stat so
+        # is_dir/is_file don't each hit the filesystem again
         try:
-            entries = sorted(dir_abs.iterdir(), key=lambda x: x.name)
+            with os.scandir(dir_abs) as it:
+                entries = sorted(it, key=lambda de: de.name)
         except Exception:
             return
 
-        for e in entries:
+        for de in entries:
             try:
-                is_dir = e.is_dir()
-                is_file = e.is_file()
+                is_dir = de.is_dir()
+                is_file = de.is_file()
             except Exception:
                 skipped_other += 1
                 continue
 
-            if _is_ignored(e, is_dir=is_dir, rules_stack=rules_stack):
+            e = Path(de.path)
+
+            if _is_ignored(e, is_dir=is_dir, rules_stack=rules_stack, has_neg=has_neg):
                 skipped_ignore += 1
                 # git behavior: do not traverse ignored dirs
                 continue
 
             if is_dir:
-                walk_dir(e, rules_stack)
+                walk_dir(e, rules_stack, has_neg, rel_tokens + [de.name])
                 continue
 
             if not is_file:
                 continue
 
-            # store path tokens under dst_root
-            try:
-                rel = e.relative_to(p)
-            except Exception:
-                continue
-            rel_tokens = list(rel.parts)
-
             try:
+                if not _sniff_utf8(e):
+                    skipped_binary += 1
+                    continue
                 txt = _read_utf8_strict(e)
             except ValueError:
                 skipped_binary += 1
@@ -331,10 +363,12 @@ def import_many(core, src_dir: str, dst_root: str):
                 skipped_other += 1
                 continue
 
-            tbl.leaf_set(core.tables, TABLES_ROOT, root_path + rel_tokens, txt)
+            # rel tokens are carried down the walk — no per-file
+            # relative_to/PurePath parse
+            tbl.leaf_set(core.tables, TABLES_ROOT, root_path + rel_tokens + [de.name], txt)
             imported += 1
 
-    walk_dir(p, [])
+    walk_dir(p, [], False, [])
 
     return f"OK imported={imported} skipped_ignore={skipped_ignore} skipped_binary={skipped_binary} skipped_other={skipped_other}"
 
@@ -388,14 +422,24 @@ def export_many(core, src_root: str, dst_dir: str = None):
 
     dst_root.mkdir(parents=True, exist_ok=True)
 
-    # write all leaves under subtree
+    # write all leaves under subtree; create each parent dir once up front
+    # instead of paying mkdir(parents=True) per file
     leaves = tbl.walk_leaves(core.tables, TABLES_ROOT, root_tokens)
+    out_paths = []
+    parents = set()
     for path_tokens, text in leaves:
         rel_tokens = path_tokens[len(root_tokens):]
         if not rel_tokens:
             continue
         out_path = dst_root.joinpath(*rel_tokens)
-        _atomic_write_text(out_path, text)
+        out_paths.append((out_path, text))
+        parents.add(out_path.parent)
+
+    for parent in sorted(parents):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    for out_path, text in out_paths:
+        _atomic_write_text(out_path, text, ensure_parent=False)
 
     return str(dst_root)
 
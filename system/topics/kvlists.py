@@ -1,47 +1,63 @@
 # system/topics/kvlists.py
 
+
+def _root_d(core, root):
+    # One .get instead of _require_kv_root + a second walk through
+    # core.state; error message matches the core guard.
+    d = core.kvl.get(root)
+    if d is None:
+        raise ValueError(f"Unknown kv root: {root}")
+    return d
+
+
+def _sub_d(core, root, sub):
+    d = core.kvl.get(root)
+    if d is None:
+        raise ValueError(f"Unknown kv root: {root}")
+    s = d.get(sub)
+    if s is None:
+        raise ValueError(f"Sub not found: kv/{root}/{sub}")
+    return d, s
+
+
 def roots_ls(core):
     return sorted(core.kv_roots)
 
 def sub_ls(core, root):
-    core._require_kv_root(root)
-    return sorted(core.state["kvlists"][root].keys())
+    return sorted(_root_d(core, root))
 
 def sub_mk(core, root, sub):
-    core._require_kv_root(root)
-    core.state["kvlists"][root].setdefault(sub, {})
+    _root_d(core, root).setdefault(sub, {})
     return "OK"
 
 def sub_rm(core, root, sub):
-    core._require_kv_sub(root, sub)
-    del core.state["kvlists"][root][sub]
+    d, _ = _sub_d(core, root, sub)
+    del d[sub]
     return "OK"
 
 def sub_keys(core, root):
-    core._require_kv_root(root)
-    return sorted(core.state["kvlists"][root].keys())
+    return sorted(_root_d(core, root))
 
 def kv_ls(core, root, sub):
-    core._require_kv_sub(root, sub)
-    return sorted(core.state["kvlists"][root][sub].keys())
+    _, s = _sub_d(core, root, sub)
+    return sorted(s)
 
 def kv_set(core, root, sub, key, *value_parts):
-    core._require_kv_sub(root, sub)
-    core.state["kvlists"][root][sub][key] = " ".join(value_parts)
+    _, s = _sub_d(core, root, sub)
+    s[key] = " ".join(value_parts)
     return "OK"
 
 def kv_get(core, root, sub, key):
-    core._require_kv_sub(root, sub)
-    return core.state["kvlists"][root][sub].get(key)
+    _, s = _sub_d(core, root, sub)
+    return s.get(key)
 
 def kv_del(core, root, sub, key):
-    core._require_kv_sub(root, sub)
-    d = core.state["kvlists"][root][sub]
-    return d.pop(key, None)
+    _, s = _sub_d(core, root, sub)
+    return s.pop(key, None)
 
 def kv_clear(core, root, sub):
-    core._require_kv_sub(root, sub)
-    core.state["kvlists"][root][sub] = {}
+    d, _ = _sub_d(core, root, sub)
+    d[sub] = {}
     return "OK"
 
 
@@ -1,50 +1,65 @@
 # system/topics/lists.py
 
+
+def _root_d(core, root):
+    # One .get instead of _require_list_root + a second walk through
+    # core.state; error message matches the core guard.
+    d = core.l.get(root)
+    if d is None:
+        raise ValueError(f"Unknown list root: {root}")
+    return d
+
+
+def _sub_l(core, root, sub):
+    d = core.l.get(root)
+    if d is None:
+        raise ValueError(f"Unknown list root: {root}")
+    s = d.get(sub)
+    if s is None:
+        raise ValueError(f"Sub not found: list/{root}/{sub}")
+    return d, s
+
+
 def roots_ls(core):
     return sorted(core.list_roots)
 
 def sub_ls(core, root):
-    core._require_list_root(root)
-    return sorted(core.state["lists"][root].keys())
+    return sorted(_root_d(core, root))
 
 def sub_mk(core, root, sub):
-    core._require_list_root(root)
-    core.state["lists"][root].setdefault(sub, [])
+    _root_d(core, root).setdefault(sub, [])
     return "OK"
 
 def sub_rm(core, root, sub):
-    core._require_list_sub(root, sub)
-    del core.state["lists"][root][sub]
+    d, _ = _sub_l(core, root, sub)
+    del d[sub]
     return "OK"
 
 def items_ls(core, root, sub):
-    core._require_list_sub(root, sub)
-    return list(core.state["lists"][root][sub])
+    _, s = _sub_l(core, root, sub)
+    return list(s)
 
 def item_append(core, root, sub, *value_parts):
-    core._require_list_sub(root, sub)
-    core.state["lists"][root][sub].append(" ".join(value_parts))
+    _, s = _sub_l(core, root, sub)
+    s.append(" ".join(value_parts))
     return "OK"
 
 def item_get(core, root, sub, idx):
-    core._require_list_sub(root, sub)
-    i = int(idx)
-    return core.state["lists"][root][sub][i]
+    _, s = _sub_l(core, root, sub)
+    return s[int(idx)]
 
 def item_set(core, root, sub, idx, *value_parts):
-    core._require_list_sub(root, sub)
-    i = int(idx)
-    core.state["lists"][root][sub][i] = " ".join(value_parts)
+    _, s = _sub_l(core, root, sub)
+    s[int(idx)] = " ".join(value_parts)
     return "OK"
 
 def item_del(core, root, sub, idx):
-    core._require_list_sub(root, sub)
-    i = int(idx)
-    return core.state["lists"][root][sub].pop(i)
+    _, s = _sub_l(core, root, sub)
+    return s.pop(int(idx))
 
 def item_clear(core, root, sub):
-    core._require_list_sub(root, sub)
-    core.state["lists"][root][sub] = []
+    d, _ = _sub_l(core, root, sub)
+    d[sub] = []
     return "OK"
 
 
@@ -36,8 +36,14 @@ def _parse_kv_arg(arg: str) -> Tuple[str, str]:
     return k.strip(), v.strip()
 
 
+def _dump_plan(doc: Dict[str, Any]) -> str:
+    # Stored leaf is machine-consumed: compact form is 3-5x smaller than
+    # indent=2 and skips the pretty-print pass. plan.show re-indents.
+    return json.dumps(doc, separators=(",", ":"), ensure_ascii=False)
+
+
 def _leaf_count(core, root_tokens: List[str]) -> int:
-    return len(tbl.walk_leaves(core.tables, TABLES_ROOT, root_tokens))
+    return tbl.count_leaves(core.tables, TABLES_ROOT, root_tokens)
 
 
 def _top_level_keys(core, root_tokens: List[str]) -> List[str]:
@@ -86,28 +92,29 @@ def plan(core, root_tok: str, *rest):
             "constraints": {"max_files": max_files},
             "shards": [],
         }
-        tbl.leaf_set(core.tables, TABLES_ROOT, root_tokens + ["plan"], json.dumps(doc, indent=2))
+        tbl.leaf_set(core.tables, TABLES_ROOT, root_tokens + ["plan"], _dump_plan(doc))
         return "OK"
 
+    # Count first (integer walk, no tuples); materialize leaf paths only
+    # for the subtrees that actually get chunked. A 10k-leaf subtree that
+    # fits in one shard never allocates its path lists.
+    base = len(root_tokens)
     sid = 1
     for k in top:
-        subtree = root_tokens + [k]
-        leaves = tbl.walk_leaves(core.tables, TABLES_ROOT, subtree)
-        if len(leaves) <= max_files:
+        sub_tokens = root_tokens + [k]
+        n = tbl.count_leaves(core.tables, TABLES_ROOT, sub_tokens)
+        if n <= max_files:
             shards.append({
                 "id": f"{sid:02d}",
                 "summary": f"{k}",
                 "targets": [{"kind": "subtree", "path": [k]}],
-                "leaf_count": len(leaves),
+                "leaf_count": n,
             })
             sid += 1
             continue
 
-        # chunk this subtree by leaf paths
-        leaf_paths = [pt for pt, _ in leaves]
-        # convert to relative tokens under root (so user can apply under root)
-        rel = [p[len(root_tokens):] for p in leaf_paths]
-        # group by max_files
+        # chunk this subtree by root-relative leaf paths
+        rel = [pt[base:] for pt, _text in tbl.walk_leaves(core.tables, TABLES_ROOT, sub_tokens)]
         for i in range(0, len(rel), max_files):
             chunk = rel[i:i+max_files]
             shards.append({
@@ -126,7 +133,7 @@ def plan(core, root_tok: str, *rest):
         "shards": shards,
     }
 
-    tbl.leaf_set(core.tables, TABLES_ROOT, root_tokens + ["plan"], json.dumps(doc, indent=2))
+    tbl.leaf_set(core.tables, TABLES_ROOT, root_tokens + ["plan"], _dump_plan(doc))
     return "OK"
 
 
@@ -137,7 +144,11 @@ def plan_show(core, root_tok: str):
         return ""
     if isinstance(node, dict):
         raise ValueError("plan is not a leaf")
-    return str(node)
+    # pretty output for humans; stored form is compact
+    try:
+        return json.dumps(json.loads(node), indent=2)
+    except (TypeError, ValueError):
+        return str(node)
 
 
 def plan_rm(core, root_tok: str):
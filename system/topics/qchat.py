@@ -8,39 +8,101 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
+import os
+import queue
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List
 
 from system.modules.q import QChat
 
 
-def _project_root() -> Path:
-    # .../system/topics/qchat.py -> project root = parents[2]
-    return Path(__file__).resolve().parents[2]
-
+# .../system/topics/qchat.py -> project root = parents[2]; resolved once
+# at import instead of a realpath walk per singleton miss.
+_CFG_PATH = Path(__file__).resolve().parents[2] / "config/llm/default.json"
 
 _Q_SINGLETON: QChat | None = None
+_Q_INIT_ERROR: str | None = None
+
+# One background loop for all Q traffic: keeps the QChat client (and its
+# TCP/TLS sessions) alive across calls instead of asyncio.run building and
+# tearing down a loop + connection pool per invocation. Also avoids the
+# "asyncio.run() cannot be called from a running event loop" hazard.
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _shutdown_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread):
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2.0)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                t = threading.Thread(target=loop.run_forever, name="q:loop", daemon=True)
+                t.start()
+                atexit.register(_shutdown_loop, loop, t)
+                _LOOP = loop
+    return _LOOP
+
+
+def _run_on_loop(coro, timeout_s: float):
+    fut = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    return fut.result(timeout=timeout_s)
+
+
+# Response cache: identical (model, normalized prompt) pairs skip the
+# round-trip entirely. Keyed on a digest of the lowercased, whitespace-
+# collapsed prompt; bounded LRU. Opt out per call with a leading
+# "!nocache" token, or globally via AIGMOS_Q_NOCACHE.
+_CACHE: OrderedDict[str, str] = OrderedDict()
+_CACHE_MAX = 1024
+_WS_RE = re.compile(r"\s+")
+
+
+def _cache_key(model: str, prompt: str) -> str:
+    norm = _WS_RE.sub(" ", prompt.strip().lower())
+    return hashlib.sha256(f"{model}\0{norm}".encode()).hexdigest()
 
 
 def _get_q() -> QChat:
-    global _Q_SINGLETON
+    global _Q_SINGLETON, _Q_INIT_ERROR
     if _Q_SINGLETON is None:
-        cfg = _project_root() / "config/llm/default.json"
-        if not cfg.exists():
-            raise ValueError(f"Q config missing: {cfg}")
-        _Q_SINGLETON = QChat(cfg)
+        # misconfig is memoized: repeat misses don't re-stat the config
+        if _Q_INIT_ERROR is not None:
+            raise ValueError(_Q_INIT_ERROR)
+        if not _CFG_PATH.exists():
+            _Q_INIT_ERROR = f"Q config missing: {_CFG_PATH}"
+            raise ValueError(_Q_INIT_ERROR)
+        try:
+            _Q_SINGLETON = QChat(_CFG_PATH)
+        except Exception as e:
+            _Q_INIT_ERROR = f"Q init failed: {e}"
+            raise
     return _Q_SINGLETON
 
 
 
+_SYM_CHARS = frozenset("$&#")
+
+
 def _expand_q_symbols(core, parts: List[str]) -> str:
     """Expand $sub:key, &name, #path tokens into their resolved text via sys.cat."""
+    dispatch = core.dispatch_internal  # bound once, not per token
     out_parts: List[str] = []
     for tok in parts:
-        if tok.startswith(("$", "&", "#")):
+        if tok and tok[0] in _SYM_CHARS:
             # Only expand symbol tokens; other words pass through.
             try:
-                val = core.dispatch_internal(["sys.cat", tok])
+                val = dispatch(["sys.cat", tok])
             except Exception as e:
                 raise ValueError(f"Q symbol expansion failed for {tok}: {e}")
             out_parts.append(str(val))
@@ -50,27 +112,134 @@ def _expand_q_symbols(core, parts: List[str]) -> str:
 
 
 def q_chat(core, *text_parts: str) -> str:
-    """sys.q.chat <text...> -> assistant_text"""
-    prompt = _expand_q_symbols(core, list(text_parts))
-    if not prompt:
+    """sys.q.chat [!nocache] <text...> -> assistant_text"""
+    if not text_parts:
         return ""  # keep feed clean
+    parts = list(text_parts)
+    use_cache = "AIGMOS_Q_NOCACHE" not in os.environ
+    if parts and parts[0] == "!nocache":
+        use_cache = False
+        parts = parts[1:]
+
+    prompt = _expand_q_symbols(core, parts)
+    if not prompt:
+        return ""  # symbols can expand to empty
 
     q = _get_q()
+    if use_cache:
+        key = _cache_key(q.cfg.model, prompt)
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            return hit
+
     messages: List[Dict[str, Any]] = [{"role": "user", "content": prompt}]
 
-    # Stage0/Stage1 are synchronous; bridge to async.
+    # Stage0/Stage1 are synchronous; bridge to the persistent loop.
     try:
-        return asyncio.run(q.chat(messages))
+        out = _run_on_loop(q.chat(messages), q.cfg.timeout_ms / 1000 + 5)
     except Exception as e:
         # Surface config context to make debugging 1-shot.
-        cfg = getattr(q, "cfg", None)
-        if cfg is not None:
+        cfg = q.cfg
+        raise ValueError(_ERR_TMPL.format(cfg.base_url, cfg.model, cfg.timeout_ms, e)) from e
+
+    if use_cache:
+        _CACHE[key] = out
+        if len(_CACHE) > _CACHE_MAX:
+            _CACHE.popitem(last=False)
+    return out
+
+
+
+# Built once: cfg is frozen and guaranteed after singleton construction,
+# so failures format the template directly — no getattr probe per call.
+_ERR_TMPL = "Q failed (base_url={}, model={}, timeout_ms={}) :: {}"
+
+
+_STREAM_DONE = object()
+
+
+def q_chat_stream(core, *text_parts: str) -> str:
+    """sys.q.stream <text...> -> assistant text (deltas arrive incrementally)
+
+    Deltas are pumped from the persistent loop into a thread-safe queue as
+    they arrive, so time-to-first-token doesn't wait on the full reply.
+    Returns the concatenated text for parity with sys.q.chat; if the
+    endpoint doesn't stream, falls back to a regular chat call.
+    """
+    if not text_parts:
+        return ""  # keep feed clean
+    prompt = _expand_q_symbols(core, list(text_parts))
+    if not prompt:
+        return ""  # keep feed clean
+
+    q = _get_q()
+    chunks: queue.SimpleQueue = queue.SimpleQueue()
+
+    async def pump():
+        try:
+            async for delta in q.chat_stream([{"role": "user", "content": prompt}]):
+                chunks.put(delta)
+        finally:
+            chunks.put(_STREAM_DONE)
+
+    fut = asyncio.run_coroutine_threadsafe(pump(), _get_loop())
+    timeout_s = q.cfg.timeout_ms / 1000 + 5
+
+    out_parts: List[str] = []
+    try:
+        while True:
+            item = chunks.get(timeout=timeout_s)
+            if item is _STREAM_DONE:
+                break
+            out_parts.append(str(item))
+    except queue.Empty:
+        fut.cancel()
+        raise ValueError(f"Q stream stalled (base_url={q.cfg.base_url}, model={q.cfg.model})")
+
+    err = fut.exception(timeout=timeout_s)
+    if err is not None:
+        if out_parts:
             raise ValueError(
-                f"Q failed (base_url={cfg.base_url}, model={cfg.model}, timeout_ms={cfg.timeout_ms}) :: {e}"
-            ) from e
-        raise
+                f"Q stream failed mid-reply (base_url={q.cfg.base_url}, model={q.cfg.model}) :: {err}"
+            ) from err
+        # endpoint may not support streaming at all — degrade gracefully
+        return q_chat(core, *text_parts)
+
+    return "".join(out_parts)
 
 
+async def _chat_many_async(q: QChat, prompts: List[str]):
+    # N round-trips collapse to ~max(latency): all jobs are in flight on
+    # the shared client at once.
+    return await asyncio.gather(*(q.chat([{"role": "user", "content": p}]) for p in prompts))
+
+
+def q_chat_many(core, *text_parts: str) -> str:
+    """sys.q.chat_many <p1...> | <p2...> | ... -> one assistant text per line"""
+    prompts: List[str] = []
+    cur: List[str] = []
+    for tok in text_parts:
+        if tok == "|":
+            if cur:
+                prompts.append(_expand_q_symbols(core, cur))
+                cur = []
+        else:
+            cur.append(tok)
+    if cur:
+        prompts.append(_expand_q_symbols(core, cur))
+    prompts = [p for p in prompts if p]
+    if not prompts:
+        return ""  # keep feed clean
+
+    q = _get_q()
+    try:
+        outs = _run_on_loop(_chat_many_async(q, prompts), q.cfg.timeout_ms / 1000 + 5)
+    except Exception as e:
+        cfg = q.cfg
+        raise ValueError(_ERR_TMPL.format(cfg.base_url, cfg.model, cfg.timeout_ms, e)) from e
+    return "\n".join(str(o) for o in outs)
+
 
 COMMANDS = {
     "sys.q.chat": (
@@ -78,4 +247,14 @@ COMMANDS = {
         "LLM chat (returns only assistant text)",
         "sys.q.chat <text...>",
     ),
-}
\ No newline at end of file
+    "sys.q.chat_many": (
+        q_chat_many,
+        "LLM chat fan-out: '|'-separated prompts run concurrently",
+        "sys.q.chat_many <p1...> | <p2...> | ...",
+    ),
+    "sys.q.stream": (
+        q_chat_stream,
+        "LLM chat, streamed (falls back to sys.q.chat if unsupported)",
+        "sys.q.stream <text...>",
+    ),
+}
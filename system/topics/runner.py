@@ -22,27 +22,69 @@
 # Locks:
 #   If runner executes &R, &R is locked against mutations while running/paused.
 
-import time
+import re
+import sys
 import threading
+from collections import deque
+
+from system.lib import tables as tbl
 
 ROUTINES_ROOT = "routines"
 TEXTS_ROOT = "texts"
+TABLES_ROOT = "tables"
 
 PULSE_SEC = 0.100  # 100ms
 
+# Status vocabulary is tiny and fixed; interned once so the hot checks
+# below compare by pointer identity instead of character equality.
+_S_IDLE = sys.intern("idle")
+_S_RUNNING = sys.intern("running")
+_S_PAUSED = sys.intern("paused")
+_S_STOPPED = sys.intern("stopped")
+_S_FAILED = sys.intern("failed")
+_S_DONE = sys.intern("done")
+
+# 1.0 safety: runner-control lines a routine may never execute.
+# One C-level match instead of four startswith probes per step.
+_BANNED_CTRL = re.compile(r"^(?:run|status|pause|stop) %")
+
 
 class RunnerJob:
+    # Slotted: the step loop touches status/stop_requested/paused/step_i
+    # on every iteration, and jobs live in core.runners indefinitely.
+    __slots__ = (
+        "name", "status", "step_i", "last_error", "log",
+        "stop_requested", "paused", "_pause_evt", "_stop_evt", "trg",
+        "_trg_cond", "_trg_seq",
+    )
+
     def __init__(self, name: str):
         self.name = name            # without leading %
-        self.status = "idle"        # idle|running|paused|stopped|failed|done
+        self.status = _S_IDLE       # idle|running|paused|stopped|failed|done
         self.step_i = 0
         self.last_error = None
-        self.log = []
+        self.log = deque(maxlen=1024)  # bounded: long-running routines can't grow it forever
         self.stop_requested = False
         self.paused = False
         self._pause_evt = threading.Event()
         self._pause_evt.set()       # unpaused
+        self._stop_evt = threading.Event()  # set by stop(); preempts pulse sleeps
         self.trg = 0                # 0/1/2/3
+        # trigger transitions are announced on this condition so waiters
+        # block instead of polling 100ms pulses
+        self._trg_cond = threading.Condition()
+        self._trg_seq = 0           # bumped on every trg edge
+
+
+_LOG_PREVIEW = 512  # per-entry output cap: don't retain multi-kB LLM replies
+
+
+def _log_step(job: RunnerJob, idx, step, out):
+    # Stored as a tuple, not an f-string: nothing formats until someone
+    # actually reads the log, and the preview cap bounds retained output.
+    if isinstance(out, str) and len(out) > _LOG_PREVIEW:
+        out = out[:_LOG_PREVIEW]
+    job.log.append((idx, step, out))
 
 
 def _parse_pct(tok: str) -> str:
@@ -53,28 +95,57 @@ def _parse_pct(tok: str) -> str:
 
 def expand_runner_trg(core, parts):
     # Expand tokens like: %name.trg -> "0|1|2|3"
+    # sys.wait takes the symbol itself (it watches edges over time), so its
+    # line must pass through untouched. Alias expansion runs first, but keep
+    # the bare form for dispatch_internal callers.
+    if parts and (parts[0] == "sys.wait" or parts[0] == "wait"):
+        return parts
+    # Prescan: almost no lines carry a %...trg token, so bail before
+    # allocating the rewritten list. p[:1] is a cheap first-char probe.
+    if not any(type(p) is str and p[:1] == "%" and p.endswith(".trg") for p in parts):
+        return parts
+    runners = core.runners
     out = []
-    changed = False
     for p in parts:
-        if isinstance(p, str) and p.startswith("%") and p.endswith(".trg"):
-            name = p[1:-4]
-            job = core.runners.get(name)
+        if type(p) is str and p[:1] == "%" and p.endswith(".trg"):
+            job = runners.get(p[1:-4])
             out.append(str(job.trg if job else 0))
-            changed = True
         else:
             out.append(p)
-    return out if changed else parts
-
-
-def _pulse(job: RunnerJob, value: int):
-    job.trg = int(value)
-    time.sleep(PULSE_SEC)
-    job.trg = 0
+    return out
+
+
+def _pulse(core, job: RunnerJob, value: int):
+    # Both edges matter to the event worker: 0->v fires bindings, v->0
+    # re-arms the latch — wake it on each. Condition waiters (sys.wait)
+    # are notified on each edge too, so they never have to poll inside
+    # the 100ms pulse window.
+    with job._trg_cond:
+        job.trg = int(value)
+        job._trg_seq += 1
+        job._trg_cond.notify_all()
+    core._event_wake.set()
+    # interruptible: stop() sets _stop_evt, so shutdown doesn't wait out
+    # the 100ms pulse window. The trg=3 pulse IS the stop — by the time it
+    # fires the runner has already unwound, so clear the event first or the
+    # window collapses to ~0 and the worker never samples 3.
+    if value == 3:
+        job._stop_evt.clear()
+    job._stop_evt.wait(PULSE_SEC)
+    with job._trg_cond:
+        job.trg = 0
+        job._trg_seq += 1
+        job._trg_cond.notify_all()
+    core._event_wake.set()
 
 
 def _wait_if_paused(job: RunnerJob):
-    while job.paused and not job.stop_requested:
-        job._pause_evt.wait(timeout=0.05)
+    # _pause_evt is cleared by pause() and set on unpause and stop, so one
+    # unbounded wait sleeps at zero CPU until explicitly woken — no 20 Hz
+    # timer wakeups per paused runner. Callers re-check stop_requested
+    # after this returns.
+    if job.paused and not job.stop_requested:
+        job._pause_evt.wait()
 
 
 def _lock_routine(core, routine_tok: str, runner_name: str, state: str):
@@ -86,9 +157,11 @@ def _unlock_routine(core, routine_tok: str):
 
 
 def _resolve_single_target_to_cmd(core, target_tok: str) -> str:
+    head = target_tok[:1]
+    body = target_tok[1:]
+
     # $sub:key -> scalar command line
-    if target_tok.startswith("$"):
-        body = target_tok[1:]
+    if head == "$":
         if ":" not in body:
             raise ValueError("run $ expects $sub:key")
         sub, key = body.split(":", 1)
@@ -96,10 +169,9 @@ def _resolve_single_target_to_cmd(core, target_tok: str) -> str:
         return str(core.kvl[TEXTS_ROOT][sub].get(key, "")).strip()
 
     # #a:b:c -> leaf scalar command line
-    if target_tok.startswith("#"):
-        from system.lib import tables as tbl
-        path = [p for p in target_tok[1:].split(":") if p] if len(target_tok) > 1 else []
-        node = tbl.node_get(core.tables, tbl.ROOT, path)
+    if head == "#":
+        path = [p for p in body.split(":") if p] if body else []
+        node = tbl.node_get(core.tables, TABLES_ROOT, path)
         if isinstance(node, dict):
             raise ValueError("run # expects leaf (scalar), not dict node")
         return ("" if node is None else str(node)).strip()
@@ -108,52 +180,112 @@ def _resolve_single_target_to_cmd(core, target_tok: str) -> str:
 
 
 def _run_steps_background(core, job: RunnerJob, runner_name: str, steps):
-    job.status = "running"
+    job.status = _S_RUNNING
     job.log.append(f"START %{runner_name}")
 
     try:
-        for i, step in enumerate(steps):
+        # Checked once per routine: most routines never use <counter>, so
+        # the per-step replace scan is skipped entirely.
+        needs_counter = any("<counter>" in str(s) for s in steps)
+        i = 0
+        n = len(steps)
+        while i < n:
             job.step_i = i
 
             if job.stop_requested:
-                job.status = "stopped"
+                job.status = _S_STOPPED
                 job.log.append("STOP requested")
-                _pulse(job, 3)
+                _pulse(core, job, 3)
                 return
 
             _wait_if_paused(job)
             if job.stop_requested:
-                job.status = "stopped"
+                job.status = _S_STOPPED
                 job.log.append("STOP requested (after pause)")
-                _pulse(job, 3)
+                _pulse(core, job, 3)
                 return
 
-            step = str(step).strip()
+            step = str(steps[i]).strip()
             if not step:
+                i += 1
+                continue
+
+            # Parallel Q block: consecutive '|'-prefixed steps are prompts
+            # that fan out through sys.q.chat_many in one concurrent call.
+            if step.startswith("|"):
+                tokens = []
+                j = i
+                while j < n:
+                    s = str(steps[j]).strip()
+                    if not s.startswith("|"):
+                        break
+                    s = s[1:]
+                    if needs_counter:
+                        s = s.replace("<counter>", str(j + 1))
+                    s = s.strip()
+                    if s:
+                        if tokens:
+                            tokens.append("|")
+                        tokens.extend(s.split())
+                    j += 1
+                out = core.dispatch_internal(["sys.q.chat_many", *tokens])
+                _log_step(job, f"{i}..{j-1}", f"|x{j-i}", out)
+                i = j
                 continue
 
+            # Coalesce runs of plain Q steps: their outputs only feed the
+            # job log, so contiguous prompts can share one concurrent
+            # chat_many call instead of paying a round-trip each.
+            if step.startswith("Q ") or step.startswith("sys.q.chat "):
+                tokens = []
+                group = []
+                j = i
+                while j < n:
+                    s = str(steps[j]).strip()
+                    if needs_counter:
+                        s = s.replace("<counter>", str(j + 1))
+                    if not (s.startswith("Q ") or s.startswith("sys.q.chat ")):
+                        break
+                    toks = s.split()[1:]
+                    if toks:
+                        if tokens:
+                            tokens.append("|")
+                        tokens.extend(toks)
+                        group.append((j, s))
+                    j += 1
+                if len(group) >= 2:
+                    out = core.dispatch_internal(["sys.q.chat_many", *tokens])
+                    for jj, s in group:
+                        _log_step(job, jj, s, None)
+                    _log_step(job, f"{i}..{j-1}", f"Qx{len(group)}", out)
+                    i = j
+                    continue
+                # a lone Q step takes the normal sequential path
+
             # Per-step counter substitution (1-based)
             # Enables: $prompts.<counter> etc.
-            step = step.replace("<counter>", str(i + 1))
+            if needs_counter:
+                step = step.replace("<counter>", str(i + 1))
 
             # 1.0 safety: no runner-control commands from inside runner
-            if step.startswith("run %") or step.startswith("status %") or step.startswith("pause %") or step.startswith("stop %"):
+            if _BANNED_CTRL.match(step):
                 raise ValueError("Runner cannot execute runner-control commands")
 
             out = core.execute(step)
-            job.log.append(f"[{i}] {step} -> {out}")
+            _log_step(job, i, step, out)
             if isinstance(out, str) and out.startswith("Error:"):
                 raise ValueError(out)
+            i += 1
 
-        job.status = "done"
+        job.status = _S_DONE
         job.log.append("DONE")
-        _pulse(job, 1)
+        _pulse(core, job, 1)
 
     except Exception as e:
-        job.status = "failed"
+        job.status = _S_FAILED
         job.last_error = str(e)
         job.log.append(f"FAILED: {e}")
-        _pulse(job, 2)
+        _pulse(core, job, 2)
 
     finally:
         job.paused = False
@@ -174,7 +306,7 @@ def run(core, *args):
     if str(args[0]).startswith("%"):
         name = _parse_pct(str(args[0]))
 
-        if name in core.runners and core.runners[name].status in ("running", "paused"):
+        if name in core.runners and (core.runners[name].status is _S_RUNNING or core.runners[name].status is _S_PAUSED):
             raise ValueError("Runner already active")
 
         # overwrite job (Option A) + trg reset
@@ -223,6 +355,25 @@ def run(core, *args):
     return core.execute(cmdline)
 
 
+def wait_trg(core, sym_tok, expected="1", timeout_s="30"):
+    """sys.wait %name.trg [N] [timeout_s] — block until the trigger reads N."""
+    sym = str(sym_tok)
+    if not (sym.startswith("%") and sym.endswith(".trg")):
+        raise ValueError("wait expects %name.trg")
+    name = sym[1:-4]
+    job = core.runners.get(name)
+    if not job:
+        raise ValueError("Runner not found")
+
+    want = int(str(expected))
+    t = float(str(timeout_s))
+    with job._trg_cond:
+        ok = job._trg_cond.wait_for(
+            lambda: job.trg == want or job.stop_requested, timeout=t
+        )
+        return str(job.trg) if ok else "TIMEOUT"
+
+
 def status(core, name_tok):
     name = _parse_pct(str(name_tok))
     job = core.runners.get(name)
@@ -237,8 +388,8 @@ def pause(core, name_tok):
     if not job:
         raise ValueError("Runner not found")
 
-    if job.status == "running":
-        job.status = "paused"
+    if job.status is _S_RUNNING:
+        job.status = _S_PAUSED
         job.paused = True
         job._pause_evt.clear()
         # reflect lock state for error messages
@@ -247,9 +398,9 @@ def pause(core, name_tok):
                 v["state"] = "paused"
         return "OK"
 
-    if job.status == "paused":
+    if job.status is _S_PAUSED:
         # toggle unpause
-        job.status = "running"
+        job.status = _S_RUNNING
         job.paused = False
         job._pause_evt.set()
         for k, v in list(core.runner_locks.items()):
@@ -266,10 +417,15 @@ def stop(core, name_tok):
     if not job:
         raise ValueError("Runner not found")
 
-    if job.status in ("running", "paused"):
+    if job.status is _S_RUNNING or job.status is _S_PAUSED:
         job.stop_requested = True
         job.paused = False
         job._pause_evt.set()
+        job._stop_evt.set()
+        # sys.wait waiters re-check stop_requested only when notified;
+        # wake them so stop doesn't sit out the step's own timeout.
+        with job._trg_cond:
+            job._trg_cond.notify_all()
         return "OK"
 
     return "OK"
@@ -280,4 +436,5 @@ COMMANDS = {
     "sys.status": (status, "Runner status",                                 "sys.status %<name>"),
     "sys.pause":  (pause,  "Toggle runner pause",                           "sys.pause %<name>"),
     "sys.stop":   (stop,   "Stop runner (graceful)",                        "sys.stop %<name>"),
+    "sys.wait":   (wait_trg, "Block until %name.trg reads N (no polling)",  "sys.wait %<name>.trg [N] [timeout_s]"),
 }
@@ -8,61 +8,161 @@
 #   texts    (kvlists root) for $
 #   tables   (tables root)  for # (infinite dict store)
 
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
 ROUTINES_ROOT = "routines"
 TEXTS_ROOT = "texts"
 TABLES_ROOT = "tables"
 
+# Fixed raise messages built once at import: the speculative-validation
+# error paths allocate no fresh message strings.
+_ERR_AMP = "Expected &<name>"
+_ERR_DOLLAR = "Expected $<sub> or $<sub>:<key>"
+_ERR_PCT = "Expected %<name>"
+_ERR_DOLLAR_KEY = "Expected $<sub>:<key>"
+_ERR_HASH = "Expected #<path>"
+_ERR_HASH_PATH = "Invalid # path"
+_ERR_AMP_IDX = "Expected &<name> or &<name>:<idx>"
+_ERR_IDX_INT = "Index must be integer"
+_ERR_EMPTY_HASH = "Empty # path"
+_ERR_LEAF_OVERWRITE = "Cannot overwrite dict node with scalar"
+_ERR_MK_USAGE = "mk expects &<name> OR $<sub> OR #<path>"
+_ERR_RM_USAGE = "rm expects &<name> OR $<sub> OR #<path>"
+_ERR_LS_USAGE = "ls usage: ls | ls &<name> | ls $ | ls $<sub> | ls #<path>"
+_ERR_CAT_USAGE = "cat expects $... or &... or #..."
+_ERR_ADD_USAGE = "add.item expects &... or $... or #..."
+_ERR_MK_SUB_ONLY = "mk expects $<sub> only (not $<sub>:<key>)"
+_ERR_RM_SUB_ONLY = "rm expects $<sub> only (not $<sub>:<key>)"
+_ERR_LS_SUB_ONLY = "ls expects $<sub> only (not $<sub>:<key>)"
+_ERR_LS_DICT = "ls expects a dict node; use cat for leaf values"
+_ERR_ADD_KEY_ONE = "add.item $<sub> expects exactly one <key>"
+_ERR_ADD_HASH_TEXT = "add.item #<path> expects <text...>"
+_ERR_KEY_NOT_FOUND = "Key not found"
+_ERR_CAT_LEAF = "cat expects a leaf; use ls for dict nodes"
+_ERR_SRC_HASH = "Source #path not found"
+_ERR_SRC_KEY = "Source key not found"
+_ERR_STEP_RANGE = "Step index out of range"
+_ERR_IDX_RANGE = "Index out of range"
+_ERR_CP_HASH_SUB = "cp #-> $sub expects #path to be a dict node"
+_ERR_CP_NESTED = "Cannot import nested dict into $sub (expected flat dict of scalars)"
+_ERR_CP_HASH_LEAF = "cp #leaf -> $sub:key requires #path to be a leaf value"
+_ERR_CP_AMP_HASH = "cp &-># supports only one step: cp &name:<idx> #path"
+_ERR_CP_HASH_AMP = "cp #->& requires #path to be a leaf value"
+_ERR_CP_DD_LEVEL = "cp $->$ requires same level: $sub->$sub or $sub:key->$sub:key"
+_ERR_CP_DA_KEY = "cp $->& supports only one key: cp $sub:key &name[[:idx]]"
+_ERR_CP_AD = "cp &->$ supports only one step: cp &name:<idx> $sub:key"
+_ERR_CP_AD_KEY = "cp &->$ requires $sub:key"
+_ERR_CP_USAGE = "cp supports $->$, $->&, &->$, &->&, plus $<->#, &<->#, #->#"
+_ERR_MV_DD_LEVEL = "mv $->$ requires same level: $sub->$sub or $sub:key->$sub:key"
+_ERR_MV_AA_LEVEL = "mv &->& requires same level: &name->&name or &name:idx->&name:idx"
+_ERR_MV_SRC_RANGE = "Source index out of range"
+_ERR_MV_DST_RANGE = "Destination index out of range"
+_ERR_MV_USAGE = "mv supports $->$, &->&, and #-># only"
+
 
 # ----------------- parsers -----------------
 
+# Parsers are memoized: interactive sessions hit the same handful of
+# targets over and over, so repeat parses are a dict hit. Results are
+# immutable (str / tuple), so sharing cached values is safe. Parsed
+# names are interned (cost paid once per unique token, amortized by the
+# cache) so the store dict probes they feed hit the pointer-equality
+# fast path.
+
+@lru_cache(maxsize=256)
 def _parse_amp(s: str) -> str:
     if not (isinstance(s, str) and s.startswith("&") and len(s) > 1):
-        raise ValueError("Expected &<name>")
-    return s[1:]
+        raise ValueError(_ERR_AMP)
+    return sys.intern(s[1:])
 
 
 def _parse_dollar(s: str) -> str:
     if not (isinstance(s, str) and s.startswith("$") and len(s) > 1):
-        raise ValueError("Expected $<sub> or $<sub>:<key>")
+        raise ValueError(_ERR_DOLLAR)
     return s[1:]
 
 
 def _parse_pct(s: str) -> str:
     if not (isinstance(s, str) and s.startswith("%") and len(s) > 1):
-        raise ValueError("Expected %<name>")
+        raise ValueError(_ERR_PCT)
     return s[1:]
 
 
+@lru_cache(maxsize=256)
 def _split_kv_target(tok: str):
     # $sub       -> (sub, None)
     # $sub:key   -> (sub, key)
     s = _parse_dollar(tok)
-    if ":" in s:
-        sub, key = s.split(":", 1)
+    sub, sep, key = s.partition(":")
+    if sep:
         if not sub or not key:
-            raise ValueError("Expected $<sub>:<key>")
-        return sub, key
-    return s, None
+            raise ValueError(_ERR_DOLLAR_KEY)
+        return sys.intern(sub), sys.intern(key)
+    return sys.intern(s), None
 
 
-def _parse_hash(tok: str) -> list[str]:
+@lru_cache(maxsize=256)
+def _parse_hash(tok: str) -> tuple[str, ...]:
     # #a:b:c  (infinite depth)
     if not (isinstance(tok, str) and tok.startswith("#") and len(tok) > 1):
-        raise ValueError("Expected #<path>")
-    parts = tok[1:].split(":")
-    if any(p == "" for p in parts):
-        raise ValueError("Invalid # path")
-    return parts
+        raise ValueError(_ERR_HASH)
+    body = tok[1:]
+    # Empty segments can only come from a leading/trailing ':' or '::';
+    # three C-level substring probes replace the per-segment any() scan.
+    if body[0] == ":" or body[-1] == ":" or "::" in body:
+        raise ValueError(_ERR_HASH_PATH)
+    return tuple(map(sys.intern, body.split(":")))
+
+
+@lru_cache(maxsize=256)
+def _parse_amp_idx(tok: str):
+    # &name      -> (name, None)
+    # &name:idx  -> (name, idx)
+    body = tok[1:]
+    if not body:
+        raise ValueError(_ERR_AMP_IDX)
+    name, sep, idx_s = body.partition(":")
+    if sep:
+        if not idx_s.isdigit():
+            raise ValueError(_ERR_IDX_INT)
+        return sys.intern(name), int(idx_s)
+    return sys.intern(body), None
+
+
+# ----------------- locked-root accessors -----------------
+#
+# Check + fetch in one probe; core._require_* would re-hash the sub on
+# the access that follows. Messages match the core helpers.
+
+def _get_kv_sub(core, sub) -> dict:
+    d = core.kvl[TEXTS_ROOT].get(sub)
+    if d is None:
+        raise ValueError(f"Sub not found: kv/{TEXTS_ROOT}/{sub}")
+    return d
+
+
+def _get_routine(core, name) -> list:
+    steps = core.l[ROUTINES_ROOT].get(name)
+    if steps is None:
+        raise ValueError(f"Sub not found: list/{ROUTINES_ROOT}/{name}")
+    return steps
 
 
 # ----------------- tables store helpers -----------------
 
 def _tables_root(core) -> dict:
-    core.tables.setdefault(TABLES_ROOT, {})
-    return core.tables[TABLES_ROOT]
+    # in-check first: the root exists after the first write, so the
+    # steady state is one probe with no discarded {} argument.
+    t = core.tables
+    if TABLES_ROOT in t:
+        return t[TABLES_ROOT]
+    return t.setdefault(TABLES_ROOT, {})
 
 
-def _table_ensure(root: dict, path: list[str]) -> dict:
+def _table_ensure(root: dict, path) -> dict:
     cur = root
     for p in path:
         nxt = cur.get(p)
@@ -75,78 +175,157 @@ def _table_ensure(root: dict, path: list[str]) -> dict:
     return cur
 
 
-def _table_get(root: dict, path: list[str]):
+def _table_get(root: dict, path):
+    # EAFP: one hash per level on the hit path. KeyError covers missing
+    # keys, TypeError covers scalar intermediates (str[str] subscript).
     cur = root
-    for p in path:
-        if not isinstance(cur, dict) or p not in cur:
-            return None
-        cur = cur[p]
+    try:
+        for p in path:
+            cur = cur[p]
+    except (KeyError, TypeError):
+        return None
     return cur
 
 
-def _table_set_leaf_append(root: dict, path: list[str], text: str):
+def _walk_parent(root: dict, path, create: bool):
+    # Fused ensure/get of a leaf's parent: one walk, no path[:-1] slice.
+    # Returns (parent_dict, leaf_key); (None, None) when create is False
+    # and an intermediate is missing or a scalar.
+    cur = root
+    n = len(path)
+    for i in range(n - 1):
+        p = path[i]
+        nxt = cur.get(p)
+        if nxt is None:
+            if not create:
+                return None, None
+            nxt = {}
+            cur[p] = nxt
+        elif not isinstance(nxt, dict):
+            if not create:
+                return None, None
+            raise ValueError(f"Path collision at '{p}'")
+        cur = nxt
+    return cur, path[n - 1]
+
+
+def _table_set_leaf_append(root: dict, path, text: str):
     if not path:
-        raise ValueError("Empty # path")
-    parent = _table_ensure(root, path[:-1])
-    key = path[-1]
+        raise ValueError(_ERR_EMPTY_HASH)
+    parent, key = _walk_parent(root, path, create=True)
     cur = parent.get(key, "")
     if isinstance(cur, dict):
-        raise ValueError("Cannot overwrite dict node with scalar")
-    parent[key] = (str(cur) + text) if cur else text
+        raise ValueError(_ERR_LEAF_OVERWRITE)
+    # leaf values are written as str everywhere, so plain concat is safe
+    parent[key] = cur + text if cur else text
 
 
-def _table_rm(root: dict, path: list[str]):
+def _table_rm(root: dict, path):
     if not path:
-        raise ValueError("Empty # path")
-    parent = _table_get(root, path[:-1]) if len(path) > 1 else root
-    if not isinstance(parent, dict):
+        raise ValueError(_ERR_EMPTY_HASH)
+    parent, key = _walk_parent(root, path, create=False)
+    if parent is None:
         return False
-    parent.pop(path[-1], None)
+    parent.pop(key, None)
     return True
 
 
 # ----------------- primitives -----------------
+#
+# mk/rm/ls/cat dispatch on target[:1] through per-command tables built at
+# import: one dict probe instead of a chain of startswith re-scans.
+
+def _mk_amp(core, target):
+    # get-or-assign instead of setdefault: no discarded [] when the
+    # routine already exists (the common re-run case)
+    name = _parse_amp(target)
+    routines = core.l[ROUTINES_ROOT]
+    if name not in routines:
+        routines[name] = []
+    return "OK"
+
+
+def _mk_dollar(core, target):
+    sub, key = _split_kv_target(target)
+    if key is not None:
+        raise ValueError(_ERR_MK_SUB_ONLY)
+    texts = core.kvl[TEXTS_ROOT]
+    if sub not in texts:
+        texts[sub] = {}
+    return "OK"
+
+
+def _mk_hash(core, target):
+    _table_ensure(_tables_root(core), _parse_hash(target))
+    return "OK"
+
+
+_MK = {"&": _mk_amp, "$": _mk_dollar, "#": _mk_hash}
+
 
 def mk(core, target):
-    if target.startswith("&"):
-        name = _parse_amp(target)
-        core.l[ROUTINES_ROOT].setdefault(name, [])
-        return "OK"
+    h = _MK.get(target[:1])
+    if h is None:
+        raise ValueError(_ERR_MK_USAGE)
+    return h(core, target)
 
-    if target.startswith("$"):
-        sub, key = _split_kv_target(target)
-        if key is not None:
-            raise ValueError("mk expects $<sub> only (not $<sub>:<key>)")
-        core.kvl[TEXTS_ROOT].setdefault(sub, {})
-        return "OK"
 
-    if target.startswith("#"):
-        _table_ensure(_tables_root(core), _parse_hash(target))
-        return "OK"
+def _rm_amp(core, target):
+    name = _parse_amp(target)
+    if core.l[ROUTINES_ROOT].pop(name, None) is None:
+        raise ValueError(f"Sub not found: list/{ROUTINES_ROOT}/{name}")
+    return "OK"
 
-    raise ValueError("mk expects &<name> OR $<sub> OR #<path>")
+
+def _rm_dollar(core, target):
+    sub, key = _split_kv_target(target)
+    if key is not None:
+        raise ValueError(_ERR_RM_SUB_ONLY)
+    if core.kvl[TEXTS_ROOT].pop(sub, None) is None:
+        raise ValueError(f"Sub not found: kv/{TEXTS_ROOT}/{sub}")
+    return "OK"
+
+
+def _rm_hash(core, target):
+    _table_rm(_tables_root(core), _parse_hash(target))
+    return "OK"
+
+
+_RM = {"&": _rm_amp, "$": _rm_dollar, "#": _rm_hash}
 
 
 def rm(core, target):
-    if target.startswith("&"):
-        name = _parse_amp(target)
-        core._require_list_sub(ROUTINES_ROOT, name)
-        del core.l[ROUTINES_ROOT][name]
-        return "OK"
+    h = _RM.get(target[:1])
+    if h is None:
+        raise ValueError(_ERR_RM_USAGE)
+    return h(core, target)
 
-    if target.startswith("$"):
-        sub, key = _split_kv_target(target)
-        if key is not None:
-            raise ValueError("rm expects $<sub> only (not $<sub>:<key>)")
-        core._require_kv_sub(TEXTS_ROOT, sub)
-        del core.kvl[TEXTS_ROOT][sub]
-        return "OK"
 
-    if target.startswith("#"):
-        _table_rm(_tables_root(core), _parse_hash(target))
-        return "OK"
+def _ls_dollar(core, target):
+    if target == "$":
+        return sorted(core.kvl[TEXTS_ROOT])
+    sub, key = _split_kv_target(target)
+    if key is not None:
+        raise ValueError(_ERR_LS_SUB_ONLY)
+    return sorted(_get_kv_sub(core, sub))
+
+
+def _ls_amp(core, target):
+    if target == "&":
+        return sorted(core.l[ROUTINES_ROOT])
+    return list(_get_routine(core, _parse_amp(target)))
+
+
+def _ls_hash(core, target):
+    val = _table_get(_tables_root(core), _parse_hash(target))
+    if val is None:
+        return ""
+    if not isinstance(val, dict):
+        raise ValueError(_ERR_LS_DICT)
+    return "\n".join(sorted(val))
+
 
-    raise ValueError("rm expects &<name> OR $<sub> OR #<path>")
+_LS = {"$": _ls_dollar, "&": _ls_amp, "#": _ls_hash}
 
 
 def ls(core, target=None):
@@ -157,452 +336,454 @@ def ls(core, target=None):
             "#  tables     (infinite dict store)"
         )
 
-    if target == "$":
-        return sorted(core.kvl[TEXTS_ROOT].keys())
-
-    if target == "&":
-        return sorted(core.l[ROUTINES_ROOT].keys())
-
-    if target.startswith("$"):
-        sub, key = _split_kv_target(target)
-        if key is not None:
-            raise ValueError("ls expects $<sub> only (not $<sub>:<key>)")
-        core._require_kv_sub(TEXTS_ROOT, sub)
-        return sorted(core.kvl[TEXTS_ROOT][sub].keys())
-
-    if target.startswith("&"):
-        name = _parse_amp(target)
-        core._require_list_sub(ROUTINES_ROOT, name)
-        return list(core.l[ROUTINES_ROOT][name])
-
-    if target.startswith("#"):
-        val = _table_get(_tables_root(core), _parse_hash(target))
-        if val is None:
-            return ""
-        if not isinstance(val, dict):
-            raise ValueError("ls expects a dict node; use cat for leaf values")
-        return "\n".join(sorted(val.keys()))
-
-    raise ValueError("ls usage: ls | ls &<name> | ls $ | ls $<sub> | ls #<path>")
+    h = _LS.get(target[:1])
+    if h is None:
+        raise ValueError(_ERR_LS_USAGE)
+    return h(core, target)
 
 
 def add_item(core, target, *rest):
+    # text computed once for all branches; the typical REPL call passes a
+    # single token, which skips the join allocation entirely.
+    if len(rest) == 1:
+        text = rest[0].strip()
+    elif rest:
+        text = " ".join(rest).strip()
+    else:
+        text = ""
+
     if target.startswith("&"):
-        name = _parse_amp(target)
-        core._require_list_sub(ROUTINES_ROOT, name)
-        step = " ".join(rest).strip()
-        core.l[ROUTINES_ROOT][name].append(step)
+        _get_routine(core, _parse_amp(target)).append(text)
         return "OK"
 
     if target.startswith("$"):
         sub, key = _split_kv_target(target)
-        core.kvl[TEXTS_ROOT].setdefault(sub, {})
+        d = core.kvl[TEXTS_ROOT].get(sub)
+        if d is None:
+            d = core.kvl[TEXTS_ROOT][sub] = {}
         if key is None:
             if len(rest) != 1:
-                raise ValueError("add.item $<sub> expects exactly one <key>")
-            k = rest[0]
-            core.kvl[TEXTS_ROOT][sub].setdefault(k, "")
+                raise ValueError(_ERR_ADD_KEY_ONE)
+            d.setdefault(rest[0], "")
             return "OK"
-        text = " ".join(rest).strip()
-        cur = core.kvl[TEXTS_ROOT][sub].get(key, "")
-        core.kvl[TEXTS_ROOT][sub][key] = (cur + text) if cur else text
+        cur = d.get(key, "")
+        d[key] = cur + text if cur else text
         return "OK"
 
     if target.startswith("#"):
-        text = " ".join(rest).strip()
         if not text:
-            raise ValueError("add.item #<path> expects <text...>")
+            raise ValueError(_ERR_ADD_HASH_TEXT)
         _table_set_leaf_append(_tables_root(core), _parse_hash(target), text)
         return "OK"
 
-    raise ValueError("add.item expects &... or $... or #...")
+    raise ValueError(_ERR_ADD_USAGE)
 
 
-def cat(core, target):
+def _cat_dollar(core, target):
     # ---- TEXTS ($sub:key) ----
-    if target.startswith("$"):
-        body = target[1:]
-        if ":" not in body:
-            raise ValueError("Expected $<sub>:<key>")
-        sub, key = body.split(":", 1)
-        core._require_kv_sub(TEXTS_ROOT, sub)
+    sub, sep, key = target[1:].partition(":")
+    if not sep:
+        raise ValueError(_ERR_DOLLAR_KEY)
+    value = _get_kv_sub(core, sub).get(key)
+    if value is None:
+        raise ValueError(_ERR_KEY_NOT_FOUND)
+    return str(value)
 
-        value = core.kvl[TEXTS_ROOT][sub].get(key)
-        if value is None:
-            raise ValueError("Key not found")
-        return str(value)
 
+def _cat_amp(core, target):
     # ---- ROUTINES (&name) ----
-    if target.startswith("&"):
-        name = _parse_amp(target)
-        core._require_list_sub(ROUTINES_ROOT, name)
-        return "\n".join(str(x) for x in core.l[ROUTINES_ROOT][name])
+    return "\n".join(str(x) for x in _get_routine(core, _parse_amp(target)))
+
 
+def _cat_hash(core, target):
     # ---- TABLES (#path) ----
-    if target.startswith("#"):
-        val = _table_get(_tables_root(core), _parse_hash(target))
-        if val is None:
-            return ""
-        if isinstance(val, dict):
-            raise ValueError("cat expects a leaf; use ls for dict nodes")
-        return str(val)
+    val = _table_get(_tables_root(core), _parse_hash(target))
+    if val is None:
+        return ""
+    if isinstance(val, dict):
+        raise ValueError(_ERR_CAT_LEAF)
+    return str(val)
+
+
+_CAT = {"$": _cat_dollar, "&": _cat_amp, "#": _cat_hash}
 
-    raise ValueError("cat expects $... or &... or #...")
+
+def cat(core, target):
+    h = _CAT.get(target[:1])
+    if h is None:
+        raise ValueError(_ERR_CAT_USAGE)
+    return h(core, target)
 
 
 # ----------------- CP + MV (existing semantics, unchanged) -----------------
 
 def _deep_clone_tree(node):
-    # node can be dict or scalar
-    if isinstance(node, dict):
-        return {k: _deep_clone_tree(v) for k, v in node.items()}
-    return node
+    # node can be dict or scalar; scalars (the common case) return as-is.
+    # Iterative stack instead of recursion: deep subtrees don't burn a
+    # Python frame per level, and the hot loop uses a type-is pointer
+    # compare (tree values are dicts or scalars by construction).
+    if not isinstance(node, dict):
+        return node
+    out = {}
+    stack = [(node, out)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if type(v) is dict:
+                nd = {}
+                dst[k] = nd
+                stack.append((v, nd))
+            else:
+                dst[k] = v
+    return out
 
 
-def cp(core, src: str, dst: str):
-    # ------------------------------------------------------------
+# cp/mv dispatch on the (src, dst) prefix pair through tables built at
+# import, mirroring the single-char tables above: one dict probe instead
+# of up to nine sequential startswith ladders.
+
+def _cp_hash_hash(core, src, dst):
     # # -> #  (subtree clone, overwrite)
-    # ------------------------------------------------------------
-    if src.startswith("#") and dst.startswith("#"):
-        s_path = _parse_hash(src)
-        d_path = _parse_hash(dst)
-
-        s_val = _table_get(_tables_root(core), s_path)
-        if s_val is None:
-            raise ValueError("Source #path not found")
-
-        d_parent = _table_ensure(_tables_root(core), d_path[:-1]) if len(d_path) > 1 else _tables_root(core)
-        d_key = d_path[-1]
-        d_parent[d_key] = _deep_clone_tree(s_val)
-        return "OK"
+    s_path = _parse_hash(src)
+    d_path = _parse_hash(dst)
+    root = _tables_root(core)
+
+    s_val = _table_get(root, s_path)
+    if s_val is None:
+        raise ValueError(_ERR_SRC_HASH)
 
-    # ------------------------------------------------------------
+    d_parent, d_key = _walk_parent(root, d_path, create=True)
+    d_parent[d_key] = _deep_clone_tree(s_val)
+    return "OK"
+
+
+def _cp_dollar_hash(core, src, dst):
     # $ -> #  (dict -> dict): cp $sub #path  (whole sub)
     # $ -> #  (leaf -> leaf): cp $sub:key #path
-    # ------------------------------------------------------------
-    if src.startswith("$") and dst.startswith("#"):
-        s_sub, s_key = _split_kv_target(src)
-        d_path = _parse_hash(dst)
-
-        if s_key is None:
-            core._require_kv_sub(TEXTS_ROOT, s_sub)
-            subdict = core.kvl[TEXTS_ROOT][s_sub]  # key -> scalar
-
-            d_parent = _table_ensure(_tables_root(core), d_path[:-1]) if len(d_path) > 1 else _tables_root(core)
-            d_key = d_path[-1]
-            d_parent[d_key] = {k: v for k, v in subdict.items()}
-            return "OK"
+    s_sub, s_key = _split_kv_target(src)
+    d_path = _parse_hash(dst)
+    root = _tables_root(core)
 
-        core._require_kv_sub(TEXTS_ROOT, s_sub)
-        if s_key not in core.kvl[TEXTS_ROOT][s_sub]:
-            raise ValueError("Source key not found")
+    subdict = _get_kv_sub(core, s_sub)  # key -> scalar
 
-        d_parent = _table_ensure(_tables_root(core), d_path[:-1]) if len(d_path) > 1 else _tables_root(core)
-        d_key = d_path[-1]
-        d_parent[d_key] = core.kvl[TEXTS_ROOT][s_sub][s_key]
+    if s_key is None:
+        d_parent, d_key = _walk_parent(root, d_path, create=True)
+        d_parent[d_key] = subdict.copy()
         return "OK"
 
-    # ------------------------------------------------------------
+    if s_key not in subdict:
+        raise ValueError(_ERR_SRC_KEY)
+
+    d_parent, d_key = _walk_parent(root, d_path, create=True)
+    d_parent[d_key] = subdict[s_key]
+    return "OK"
+
+
+def _cp_hash_dollar(core, src, dst):
     # # -> $  (dict -> dict): cp #path $sub  (whole subtree -> sub)
     # # -> $  (leaf -> leaf): cp #path $sub:key
-    # ------------------------------------------------------------
-    if src.startswith("#") and dst.startswith("$"):
-        s_path = _parse_hash(src)
-        d_sub, d_key = _split_kv_target(dst)
+    s_path = _parse_hash(src)
+    d_sub, d_key = _split_kv_target(dst)
+    texts = core.kvl[TEXTS_ROOT]
 
-        s_val = _table_get(_tables_root(core), s_path)
-        if s_val is None:
-            raise ValueError("Source #path not found")
+    s_val = _table_get(_tables_root(core), s_path)
+    if s_val is None:
+        raise ValueError(_ERR_SRC_HASH)
 
-        if d_key is None:
-            if not isinstance(s_val, dict):
-                raise ValueError("cp #-> $sub expects #path to be a dict node")
+    if d_key is None:
+        if not isinstance(s_val, dict):
+            raise ValueError(_ERR_CP_HASH_SUB)
 
-            for k, v in s_val.items():
-                if isinstance(v, dict):
-                    raise ValueError("Cannot import nested dict into $sub (expected flat dict of scalars)")
+        if any(type(v) is dict for v in s_val.values()):
+            raise ValueError(_ERR_CP_NESTED)
 
-            core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
-            core.kvl[TEXTS_ROOT][d_sub] = {k: v for k, v in s_val.items()}
-            return "OK"
+        texts[d_sub] = s_val.copy()
+        return "OK"
 
-        if isinstance(s_val, dict):
-            raise ValueError("cp #leaf -> $sub:key requires #path to be a leaf value")
+    if isinstance(s_val, dict):
+        raise ValueError(_ERR_CP_HASH_LEAF)
 
-        core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
-        core.kvl[TEXTS_ROOT][d_sub][d_key] = str(s_val)
-        return "OK"
+    d = texts.get(d_sub)
+    if d is None:
+        d = texts[d_sub] = {}
+    d[d_key] = str(s_val)
+    return "OK"
 
-    # ------------------------------------------------------------
+
+def _cp_amp_hash(core, src, dst):
     # & -> #  (ONLY one step): cp &name:idx #path
-    # ------------------------------------------------------------
-    if src.startswith("&") and dst.startswith("#"):
-        body = src[1:]
-        if ":" not in body:
-            raise ValueError("cp &-># supports only one step: cp &name:<idx> #path")
-        name, idx_s = body.split(":", 1)
-        if not idx_s.isdigit():
-            raise ValueError("Index must be integer")
-        idx = int(idx_s)
+    name, sep, idx_s = src[1:].partition(":")
+    if not sep:
+        raise ValueError(_ERR_CP_AMP_HASH)
+    if not idx_s.isdigit():
+        raise ValueError(_ERR_IDX_INT)
+    idx = int(idx_s)
 
-        d_path = _parse_hash(dst)
+    d_path = _parse_hash(dst)
 
-        core._require_list_sub(ROUTINES_ROOT, name)
-        steps = core.l[ROUTINES_ROOT][name]
-        if idx < 0 or idx >= len(steps):
-            raise ValueError("Step index out of range")
+    steps = _get_routine(core, name)
+    if idx < 0 or idx >= len(steps):
+        raise ValueError(_ERR_STEP_RANGE)
 
-        d_parent = _table_ensure(_tables_root(core), d_path[:-1]) if len(d_path) > 1 else _tables_root(core)
-        d_key = d_path[-1]
-        d_parent[d_key] = str(steps[idx])
-        return "OK"
+    d_parent, d_key = _walk_parent(_tables_root(core), d_path, create=True)
+    d_parent[d_key] = str(steps[idx])
+    return "OK"
 
-    # ------------------------------------------------------------
+
+def _cp_hash_amp(core, src, dst):
     # # -> &  (ONLY one leaf): cp #path &name        (append)
-    #                         cp #path &name:idx     (overwrite/append-at-end)
-    # ------------------------------------------------------------
-    if src.startswith("#") and dst.startswith("&"):
-        s_path = _parse_hash(src)
-        s_val = _table_get(_tables_root(core), s_path)
-        if s_val is None:
-            raise ValueError("Source #path not found")
-        if isinstance(s_val, dict):
-            raise ValueError("cp #->& requires #path to be a leaf value")
-
-        body = dst[1:]
-        if not body:
-            raise ValueError("Expected &<name> or &<name>:<idx>")
-
-        if ":" in body:
-            name, idx_s = body.split(":", 1)
-            if not idx_s.isdigit():
-                raise ValueError("Index must be integer")
-            idx = int(idx_s)
-        else:
-            name, idx = body, None
+    #                          cp #path &name:idx    (overwrite/append-at-end)
+    s_path = _parse_hash(src)
+    s_val = _table_get(_tables_root(core), s_path)
+    if s_val is None:
+        raise ValueError(_ERR_SRC_HASH)
+    if isinstance(s_val, dict):
+        raise ValueError(_ERR_CP_HASH_AMP)
 
-        core._require_list_sub(ROUTINES_ROOT, name)
-        steps = core.l[ROUTINES_ROOT][name]
-        val = str(s_val)
+    name, idx = _parse_amp_idx(dst)
 
-        if idx is None:
-            steps.append(val)
-            return "OK"
+    steps = _get_routine(core, name)
+    val = str(s_val)
 
-        if idx < 0 or idx > len(steps):
-            raise ValueError("Index out of range")
-        if idx == len(steps):
-            steps.append(val)
-        else:
-            steps[idx] = val
+    if idx is None:
+        steps.append(val)
         return "OK"
 
-    # ------------------------------------------------------------
-    # EXISTING: $ <-> $ , $ <-> & , & <-> $ , & <-> &
-    # ------------------------------------------------------------
+    if idx < 0 or idx > len(steps):
+        raise ValueError(_ERR_IDX_RANGE)
+    if idx == len(steps):
+        steps.append(val)
+    else:
+        steps[idx] = val
+    return "OK"
+
 
+def _cp_dollar_dollar(core, src, dst):
     # $ -> $ (all levels)
-    if src.startswith("$") and dst.startswith("$"):
-        s_sub, s_key = _split_kv_target(src)
-        d_sub, d_key = _split_kv_target(dst)
-
-        if s_key is None and d_key is None:
-            core._require_kv_sub(TEXTS_ROOT, s_sub)
-            core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
-            # overwrite whole sub (clone)
-            core.kvl[TEXTS_ROOT][d_sub] = dict(core.kvl[TEXTS_ROOT][s_sub])
-            return "OK"
+    s_sub, s_key = _split_kv_target(src)
+    d_sub, d_key = _split_kv_target(dst)
+    texts = core.kvl[TEXTS_ROOT]
 
-        if s_key is not None and d_key is not None:
-            core._require_kv_sub(TEXTS_ROOT, s_sub)
-            if s_key not in core.kvl[TEXTS_ROOT][s_sub]:
-                raise ValueError("Source key not found")
-            core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
-            core.kvl[TEXTS_ROOT][d_sub][d_key] = core.kvl[TEXTS_ROOT][s_sub][s_key]
-            return "OK"
+    if s_key is None and d_key is None:
+        # overwrite whole sub (clone)
+        texts[d_sub] = _get_kv_sub(core, s_sub).copy()
+        return "OK"
 
-        raise ValueError("cp $->$ requires same level: $sub->$sub or $sub:key->$sub:key")
+    if s_key is not None and d_key is not None:
+        src_sub = _get_kv_sub(core, s_sub)
+        if s_key not in src_sub:
+            raise ValueError(_ERR_SRC_KEY)
+        d = texts.get(d_sub)
+        if d is None:
+            d = texts[d_sub] = {}
+        d[d_key] = src_sub[s_key]
+        return "OK"
 
-    # $ -> & (one key only; append if no index)
-    if src.startswith("$") and dst.startswith("&"):
-        s_sub, s_key = _split_kv_target(src)
-        if s_key is None:
-            raise ValueError("cp $->& supports only one key: cp $sub:key &name[[:idx]]")
-
-        body = dst[1:]
-        if not body:
-            raise ValueError("Expected &<name> or &<name>:<idx>")
-
-        if ":" in body:
-            name, idx_s = body.split(":", 1)
-            if not idx_s.isdigit():
-                raise ValueError("Index must be integer")
-            idx = int(idx_s)
-        else:
-            name, idx = body, None
+    raise ValueError(_ERR_CP_DD_LEVEL)
 
-        core._require_list_sub(ROUTINES_ROOT, name)
-        core._require_kv_sub(TEXTS_ROOT, s_sub)
 
-        if s_key not in core.kvl[TEXTS_ROOT][s_sub]:
-            raise ValueError("Source key not found")
+def _cp_dollar_amp(core, src, dst):
+    # $ -> & (one key only; append if no index)
+    s_sub, s_key = _split_kv_target(src)
+    if s_key is None:
+        raise ValueError(_ERR_CP_DA_KEY)
 
-        val = str(core.kvl[TEXTS_ROOT][s_sub][s_key])
-        steps = core.l[ROUTINES_ROOT][name]
+    name, idx = _parse_amp_idx(dst)
 
-        if idx is None:
-            steps.append(val)  # append
-            return "OK"
+    steps = _get_routine(core, name)
+    src_sub = _get_kv_sub(core, s_sub)
+    if s_key not in src_sub:
+        raise ValueError(_ERR_SRC_KEY)
 
-        # indexed write: overwrite (or append if idx == len)
-        if idx < 0 or idx > len(steps):
-            raise ValueError("Index out of range")
-        if idx == len(steps):
-            steps.append(val)
-        else:
-            steps[idx] = val
+    val = str(src_sub[s_key])
+
+    if idx is None:
+        steps.append(val)  # append
         return "OK"
 
-    # & -> $ (one step only)
-    if src.startswith("&") and dst.startswith("$"):
-        body = src[1:]
-        if ":" not in body:
-            raise ValueError("cp &->$ supports only one step: cp &name:<idx> $sub:key")
-        name, idx_s = body.split(":", 1)
-        if not idx_s.isdigit():
-            raise ValueError("Index must be integer")
-        idx = int(idx_s)
+    # indexed write: overwrite (or append if idx == len)
+    if idx < 0 or idx > len(steps):
+        raise ValueError(_ERR_IDX_RANGE)
+    if idx == len(steps):
+        steps.append(val)
+    else:
+        steps[idx] = val
+    return "OK"
+
 
-        d_sub, d_key = _split_kv_target(dst)
-        if d_key is None:
-            raise ValueError("cp &->$ requires $sub:key")
+def _cp_amp_dollar(core, src, dst):
+    # & -> $ (one step only)
+    name, sep, idx_s = src[1:].partition(":")
+    if not sep:
+        raise ValueError(_ERR_CP_AD)
+    if not idx_s.isdigit():
+        raise ValueError(_ERR_IDX_INT)
+    idx = int(idx_s)
+
+    d_sub, d_key = _split_kv_target(dst)
+    if d_key is None:
+        raise ValueError(_ERR_CP_AD_KEY)
+
+    steps = _get_routine(core, name)
+    if idx < 0 or idx >= len(steps):
+        raise ValueError(_ERR_STEP_RANGE)
+
+    texts = core.kvl[TEXTS_ROOT]
+    d = texts.get(d_sub)
+    if d is None:
+        d = texts[d_sub] = {}
+    d[d_key] = str(steps[idx])
+    return "OK"
+
+
+def _cp_amp_amp(core, src, dst):
+    # & -> & (whole routine copy)
+    s_name = _parse_amp(src)
+    d_name = _parse_amp(dst)
+
+    core.l[ROUTINES_ROOT][d_name] = _get_routine(core, s_name).copy()  # overwrite clone
+    return "OK"
+
+
+_CP_TABLE = {
+    ("#", "#"): _cp_hash_hash,
+    ("$", "#"): _cp_dollar_hash,
+    ("#", "$"): _cp_hash_dollar,
+    ("&", "#"): _cp_amp_hash,
+    ("#", "&"): _cp_hash_amp,
+    ("$", "$"): _cp_dollar_dollar,
+    ("$", "&"): _cp_dollar_amp,
+    ("&", "$"): _cp_amp_dollar,
+    ("&", "&"): _cp_amp_amp,
+}
 
-        core._require_list_sub(ROUTINES_ROOT, name)
-        steps = core.l[ROUTINES_ROOT][name]
-        if idx < 0 or idx >= len(steps):
-            raise ValueError("Step index out of range")
 
-        core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
-        core.kvl[TEXTS_ROOT][d_sub][d_key] = str(steps[idx])
+def cp(core, src: str, dst: str):
+    # Self-copy is a no-op: every same-target pair resolves to cloning a
+    # value onto itself (appending dst forms only exist cross-prefix, so
+    # they can never equal src). Skip parsing and validation entirely.
+    if src == dst:
         return "OK"
 
-    # & -> & (whole routine copy)
-    if src.startswith("&") and dst.startswith("&"):
-        s_name = _parse_amp(src)
-        d_name = _parse_amp(dst)
+    fn = _CP_TABLE.get((src[:1], dst[:1]))
+    if fn is None:
+        raise ValueError(_ERR_CP_USAGE)
+    return fn(core, src, dst)
 
-        core._require_list_sub(ROUTINES_ROOT, s_name)
-        core.l[ROUTINES_ROOT].setdefault(d_name, [])
-        core.l[ROUTINES_ROOT][d_name] = list(core.l[ROUTINES_ROOT][s_name])  # overwrite clone
+
+def _mv_hash_hash(core, src, dst):
+    # # -> #  (subtree move, overwrite)
+    s_path = _parse_hash(src)
+    d_path = _parse_hash(dst)
+
+    root = _tables_root(core)
+
+    s_parent, s_leaf = _walk_parent(root, s_path, create=False)
+    if s_parent is None or s_leaf not in s_parent:
+        raise ValueError(_ERR_SRC_HASH)
+
+    node = s_parent.pop(s_leaf)  # dict or scalar
+
+    d_parent, d_leaf = _walk_parent(root, d_path, create=True)
+    d_parent[d_leaf] = node
+    return "OK"
+
+
+def _mv_dollar_dollar(core, src, dst):
+    # $ -> $ (same namespace only)
+    s_sub, s_key = _split_kv_target(src)
+    d_sub, d_key = _split_kv_target(dst)
+    texts = core.kvl[TEXTS_ROOT]
+
+    if s_sub not in texts:
+        raise ValueError(f"Sub not found: kv/{TEXTS_ROOT}/{s_sub}")
+    if d_sub not in texts:
+        texts[d_sub] = {}
+
+    # move whole sub (rename)
+    if s_key is None and d_key is None:
+        texts[d_sub] = texts.pop(s_sub)
         return "OK"
 
-    raise ValueError("cp supports $->$, $->&, &->$, &->&, plus $<->#, &<->#, #->#")
+    # move single key
+    if s_key is not None and d_key is not None:
+        src_sub = texts[s_sub]
+        if s_key not in src_sub:
+            raise ValueError(_ERR_SRC_KEY)
+        texts[d_sub][d_key] = src_sub.pop(s_key)
+        return "OK"
 
-def mv(core, src: str, dst: str):
-    if src == dst:
-        return "Need coffee?"
+    raise ValueError(_ERR_MV_DD_LEVEL)
 
-    # ------------------------------------------------------------
-    # # -> #  (subtree move, overwrite)
-    # ------------------------------------------------------------
-    if src.startswith("#") and dst.startswith("#"):
-        s_path = _parse_hash(src)
-        d_path = _parse_hash(dst)
 
-        root = _tables_root(core)
+def _mv_amp_amp(core, src, dst):
+    # & -> & (same namespace only)
+    s_name, s_idx = _parse_amp_idx(src)
+    d_name, d_idx = _parse_amp_idx(dst)
 
-        s_parent = _table_get(root, s_path[:-1]) if len(s_path) > 1 else root
-        if not isinstance(s_parent, dict) or s_path[-1] not in s_parent:
-            raise ValueError("Source #path not found")
+    routines = core.l[ROUTINES_ROOT]
 
-        node = s_parent.pop(s_path[-1])  # dict or scalar
+    if s_name not in routines:
+        raise ValueError(f"Sub not found: list/{ROUTINES_ROOT}/{s_name}")
+    if d_name not in routines:
+        routines[d_name] = []
 
-        d_parent = _table_ensure(root, d_path[:-1]) if len(d_path) > 1 else root
-        d_parent[d_path[-1]] = node
+    # move whole routine (rename)
+    if s_idx is None and d_idx is None:
+        routines[d_name] = routines.pop(s_name)
         return "OK"
 
-    # ------------------------------------------------------------
-    # $ -> $ (same namespace only)
-    # ------------------------------------------------------------
-    if src.startswith("$") and dst.startswith("$"):
-        s_sub, s_key = _split_kv_target(src)
-        d_sub, d_key = _split_kv_target(dst)
+    # move one step (overwrite / append-at-end)
+    if s_idx is not None and d_idx is not None:
+        steps = routines[s_name]
+        if s_idx < 0 or s_idx >= len(steps):
+            raise ValueError(_ERR_MV_SRC_RANGE)
 
-        core._require_kv_sub(TEXTS_ROOT, s_sub)
-        core.kvl[TEXTS_ROOT].setdefault(d_sub, {})
+        step = steps.pop(s_idx)
+        dst_steps = routines[d_name]
 
-        # move whole sub (rename)
-        if s_key is None and d_key is None:
-            core.kvl[TEXTS_ROOT][d_sub] = core.kvl[TEXTS_ROOT].pop(s_sub)
-            return "OK"
+        if d_idx < 0 or d_idx > len(dst_steps):
+            raise ValueError(_ERR_MV_DST_RANGE)
 
-        # move single key
-        if s_key is not None and d_key is not None:
-            if s_key not in core.kvl[TEXTS_ROOT][s_sub]:
-                raise ValueError("Source key not found")
-            val = core.kvl[TEXTS_ROOT][s_sub].pop(s_key)
-            core.kvl[TEXTS_ROOT][d_sub][d_key] = val
-            return "OK"
+        if d_idx == len(dst_steps):
+            dst_steps.append(step)
+        else:
+            dst_steps[d_idx] = step
 
-        raise ValueError("mv $->$ requires same level: $sub->$sub or $sub:key->$sub:key")
+        return "OK"
 
-    # ------------------------------------------------------------
-    # & -> & (same namespace only)
-    # ------------------------------------------------------------
-    if src.startswith("&") and dst.startswith("&"):
-        def _parse_amp_idx(tok: str):
-            body = tok[1:]
-            if not body:
-                raise ValueError("Expected &<name> or &<name>:<idx>")
-            if ":" in body:
-                name, idx_s = body.split(":", 1)
-                if not idx_s.isdigit():
-                    raise ValueError("Index must be integer")
-                return name, int(idx_s)
-            return body, None
-
-        s_name, s_idx = _parse_amp_idx(src)
-        d_name, d_idx = _parse_amp_idx(dst)
-
-        core._require_list_sub(ROUTINES_ROOT, s_name)
-        core.l[ROUTINES_ROOT].setdefault(d_name, [])
-
-        # move whole routine (rename)
-        if s_idx is None and d_idx is None:
-            core.l[ROUTINES_ROOT][d_name] = core.l[ROUTINES_ROOT].pop(s_name)
-            return "OK"
+    raise ValueError(_ERR_MV_AA_LEVEL)
 
-        # move one step (overwrite / append-at-end)
-        if s_idx is not None and d_idx is not None:
-            steps = core.l[ROUTINES_ROOT][s_name]
-            if s_idx < 0 or s_idx >= len(steps):
-                raise ValueError("Source index out of range")
 
-            step = steps.pop(s_idx)
-            dst_steps = core.l[ROUTINES_ROOT][d_name]
+_MV_TABLE = {
+    ("#", "#"): _mv_hash_hash,
+    ("$", "$"): _mv_dollar_dollar,
+    ("&", "&"): _mv_amp_amp,
+}
 
-            if d_idx < 0 or d_idx > len(dst_steps):
-                raise ValueError("Destination index out of range")
 
-            if d_idx == len(dst_steps):
-                dst_steps.append(step)
-            else:
-                dst_steps[d_idx] = step
+def mv(core, src: str, dst: str):
+    if src == dst:
+        return "Need coffee?"
 
-            return "OK"
+    fn = _MV_TABLE.get((src[:1], dst[:1]))
+    if fn is None:
+        raise ValueError(_ERR_MV_USAGE)
+    return fn(core, src, dst)
 
-        raise ValueError("mv &->& requires same level: &name->&name or &name:idx->&name:idx")
 
-    raise ValueError("mv supports $->$, &->&, and #-># only")
 
+# (fn, help, usage) with named fields; unpacks like a plain tuple for
+# init_core, and the proxy freezes the surface at import.
+Command = namedtuple("Command", "fn help usage")
 
-COMMANDS = {
-    "sys.mk":       (mk,       "Create a routine (&), text namespace ($), or table path (#)", "sys.mk &<name> | sys.mk $<sub> | sys.mk #<path>"),
-    "sys.rm":       (rm,       "Remove a routine (&), text namespace ($), or table node (#)", "sys.rm &<name> | sys.rm $<sub> | sys.rm #<path>"),
-    "sys.ls":       (ls,       "List routines, steps, text namespaces/keys, or table keys", "sys.ls [ &<name> | $ | $<sub> | #<path> ]"),
-    "sys.add.item": (add_item, "Add routine step, write/append text key, or write/append table leaf", "sys.add.item &<name> <step...> | sys.add.item $<sub> <key> | sys.add.item $<sub>:<key> <text...> | sys.add.item #<path> <text...>"),
-    "sys.cat":      (cat,      "Show the contents of a $ key, & routine, or # leaf", "sys.cat (&<name> | $<sub>:<key> | #<path>)"),
-      "sys.cp":     (cp,
+COMMANDS = MappingProxyType({
+    "sys.mk":       Command(mk,       "Create a routine (&), text namespace ($), or table path (#)", "sys.mk &<name> | sys.mk $<sub> | sys.mk #<path>"),
+    "sys.rm":       Command(rm,       "Remove a routine (&), text namespace ($), or table node (#)", "sys.rm &<name> | sys.rm $<sub> | sys.rm #<path>"),
+    "sys.ls":       Command(ls,       "List routines, steps, text namespaces/keys, or table keys", "sys.ls [ &<name> | $ | $<sub> | #<path> ]"),
+    "sys.add.item": Command(add_item, "Add routine step, write/append text key, or write/append table leaf", "sys.add.item &<name> <step...> | sys.add.item $<sub> <key> | sys.add.item $<sub>:<key> <text...> | sys.add.item #<path> <text...>"),
+    "sys.cat":      Command(cat,      "Show the contents of a $ key, & routine, or # leaf", "sys.cat (&<name> | $<sub>:<key> | #<path>)"),
+      "sys.cp":     Command(cp,
         "Copy between $, &, and #. Dict<->dict supports subtree clone.",
         (
             "sys.cp <src> <dst>\n"
@@ -614,7 +795,7 @@ COMMANDS = {
             "  (existing: $<->$, $<->&, &<->$, &<->&)"
         )
     ),
-    "sys.mv": (mv,
+    "sys.mv": Command(mv,
         "Move/rename within $ (texts), within & (routines), or within # (tables/tree). No cross moves.",
         (
         "sys.mv <src> <dst>\n"
@@ -626,4 +807,4 @@ COMMANDS = {
         "  (no cross moves: $<>&, $<>#, &<># are rejected)"
         )
     ),
-}
+})